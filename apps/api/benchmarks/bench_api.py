@@ -0,0 +1,306 @@
+"""
+End-to-end load test of the API against local service stand-ins.
+
+Boots ``api.main:app`` under uvicorn in a background thread, with Supabase
+and Prisma replaced by the in-memory fakes from ``benchmarks/fakes.py``.
+Each scenario is then driven over real HTTP at a fixed concurrency by
+``benchmarks/load_driver.py``. The driver runs in a separate process so it
+doesn't compete with the server for the GIL. The script reports
+p50/p95/p99 latency, requests per second and event-loop lag. Lag is
+sampled on the server's loop, so slow synchronous work in a handler shows
+up there even if the client hides it.
+
+Results are compared against ``benchmarks/baseline.json``. The run exits
+with status 1 if any scenario is slower than its baseline by more than the
+tolerance, or if any request fails. Use ``--update-baseline`` to record new
+numbers after an intentional change. Baselines are stored per CPU count
+and concurrency, and a run with no matching baseline only reports.
+
+Usage:
+    poetry run python benchmarks/bench_api.py --concurrency 20 --requests 2000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import uvicorn
+
+os.environ.setdefault("JWT_SECRET", "bench-secret")
+
+from fakes import FakePrisma, FakeSupabase  # noqa: E402
+from load_driver import percentile  # noqa: E402
+
+from api.core.config import settings  # noqa: E402
+from api.db import client as db_client  # noqa: E402
+from api.main import app  # noqa: E402
+from api.routes.v1 import auth as auth_routes  # noqa: E402
+from api.services import auth as auth_service_module  # noqa: E402
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+DRIVER_PATH = Path(__file__).with_name("load_driver.py")
+BENCH_EMAIL = "bench@example.com"
+BENCH_PASSWORD = "bench-password"
+# Higher is better for these metrics; lower is better for everything else
+HIGHER_IS_BETTER = {"rps"}
+# p99 latency is reported but not gated: with a few thousand requests it
+# swings with scheduler noise on a shared machine
+COMPARED_METRICS = ["rps", "p50_ms", "p95_ms", "loop_lag_p99_ms"]
+
+
+SCENARIOS = {
+    "health": {"method": "GET", "path": f"{settings.API_V1_STR}/health"},
+    "openapi": {"method": "GET", "path": f"{settings.API_V1_STR}/openapi.json"},
+    "login": {
+        "method": "POST",
+        "path": f"{settings.API_V1_STR}/auth/login",
+        "data": {"username": BENCH_EMAIL, "password": BENCH_PASSWORD},
+    },
+    "me": {"method": "GET", "path": f"{settings.API_V1_STR}/auth/me", "auth": True},
+}
+
+
+class LoopLagMonitor:
+    """Samples how late ``asyncio.sleep`` wakes up on the loop it runs in."""
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.samples: List[float] = []
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - started - self.interval))
+
+    def drain(self) -> List[float]:
+        samples, self.samples = self.samples, []
+        return samples
+
+
+class InProcessServer:
+    """Runs the app under uvicorn on its own event loop in a daemon thread."""
+
+    def __init__(self, monitor: LoopLagMonitor) -> None:
+        self.monitor = monitor
+        self.base_url = ""
+        self._server: Optional[uvicorn.Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    async def _serve(self, sock: socket.socket) -> None:
+        lag = asyncio.create_task(self.monitor.run())
+        try:
+            await self._server.serve(sockets=[sock])
+        finally:
+            lag.cancel()
+
+    def start(self) -> None:
+        # asyncio only enables TCP_NODELAY on accepted sockets when the
+        # listener's proto is IPPROTO_TCP; without it keep-alive responses
+        # stall ~40ms on delayed ACKs
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+        sock.bind(("127.0.0.1", 0))
+        self.base_url = f"http://127.0.0.1:{sock.getsockname()[1]}"
+        config = uvicorn.Config(app, log_level="warning", access_log=False, lifespan="on")
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(
+            target=lambda: asyncio.run(self._serve(sock)), daemon=True
+        )
+        self._thread.start()
+        deadline = time.monotonic() + 10
+        while not self._server.started:
+            if time.monotonic() > deadline or not self._thread.is_alive():
+                raise RuntimeError("API server failed to start")
+            time.sleep(0.01)
+
+    def stop(self) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=10)
+
+
+def install_fakes(latency: float) -> FakeSupabase:
+    """Point the app at in-memory Supabase and Prisma stand-ins."""
+    supabase = FakeSupabase(latency)
+    supabase.auth.add_user(BENCH_EMAIL, BENCH_PASSWORD)
+
+    db_client.get_prisma_client.cache_clear()
+    db_client._prisma_client = FakePrisma(latency)
+
+    # Patched at the source rather than through app.dependency_overrides:
+    # FastAPI re-resolves every dependency per request while overrides are set
+    auth_service_module.create_client = lambda url, key: supabase
+    auth_routes.auth_service.supabase = supabase
+    return supabase
+
+
+def run_driver(
+    base_url: str,
+    monitor: LoopLagMonitor,
+    names: List[str],
+    concurrency: int,
+    requests: int,
+    warmup: int,
+) -> Dict[str, Dict[str, Any]]:
+    """Drive the scenarios from a ``load_driver.py`` subprocess and collect its results."""
+    plan = {
+        "base_url": base_url,
+        "login": SCENARIOS["login"],
+        "scenarios": [{"name": name, **SCENARIOS[name]} for name in names],
+        "concurrency": concurrency,
+        "requests": requests,
+        "warmup": warmup,
+    }
+    results = {}
+    with subprocess.Popen(
+        [sys.executable, str(DRIVER_PATH), json.dumps(plan)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    ) as driver:
+        for line in driver.stdout:
+            message = json.loads(line)
+            if message.pop("event") == "ready":
+                # Warmup is done; only sample lag during the measured run
+                monitor.drain()
+                driver.stdin.write("\n")
+                driver.stdin.flush()
+                continue
+            lag = monitor.drain()
+            result = {k: v for k, v in message.items() if k != "scenario"}
+            result["loop_lag_p99_ms"] = percentile(lag, 99) * 1000
+            result["loop_lag_max_ms"] = max(lag, default=0.0) * 1000
+            results[message["scenario"]] = result
+    if driver.returncode:
+        raise RuntimeError(f"Load driver exited with status {driver.returncode}")
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+    slack_ms: float,
+    lag_slack_ms: float,
+) -> List[str]:
+    """
+    Compare a run against its baseline.
+
+    Latency metrics get ``slack_ms`` of absolute headroom on top of the
+    relative tolerance so millisecond timings don't flap, and event-loop lag
+    gets ``lag_slack_ms``. A handler that blocks the loop adds far more lag
+    than that.
+
+    Returns:
+        List[str]: One message per regressed metric or failing scenario
+    """
+    regressions = []
+    for name, result in results.items():
+        if result["errors"]:
+            regressions.append(f"{name}: {result['errors']} failed requests")
+        expected = baseline.get(name)
+        if not expected:
+            continue
+        for metric in COMPARED_METRICS:
+            if metric not in expected:
+                continue
+            actual, reference = result[metric], expected[metric]
+            if metric in HIGHER_IS_BETTER:
+                limit = reference * (1 - tolerance)
+                failed = actual < limit
+            else:
+                slack = lag_slack_ms if metric.startswith("loop_lag") else slack_ms
+                limit = reference * (1 + tolerance) + slack
+                failed = actual > limit
+            if failed:
+                regressions.append(
+                    f"{name}: {metric}={actual:.2f} (baseline {reference:.2f}, limit {limit:.2f})"
+                )
+    return regressions
+
+
+def print_report(results: Dict[str, Dict[str, Any]], concurrency: int) -> None:
+    print(f"concurrency={concurrency}")
+    print(
+        f"{'scenario':>10}  {'requests':>8}  {'errors':>6}  {'rps':>9}  {'p50 ms':>8}  "
+        f"{'p95 ms':>8}  {'p99 ms':>8}  {'lag p99':>8}  {'lag max':>8}"
+    )
+    for name, r in results.items():
+        print(
+            f"{name:>10}  {r['requests']:>8}  {r['errors']:>6}  {r['rps']:>9.0f}  "
+            f"{r['p50_ms']:>8.2f}  {r['p95_ms']:>8.2f}  {r['p99_ms']:>8.2f}  "
+            f"{r['loop_lag_p99_ms']:>8.2f}  {r['loop_lag_max_ms']:>8.2f}"
+        )
+
+
+def bench(
+    names: List[str], concurrency: int, requests: int, warmup: int, backend_latency: float
+) -> Dict[str, Dict[str, Any]]:
+    install_fakes(backend_latency)
+    monitor = LoopLagMonitor()
+    server = InProcessServer(monitor)
+    server.start()
+    try:
+        return run_driver(server.base_url, monitor, names, concurrency, requests, warmup)
+    finally:
+        server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=2000, help="requests per scenario")
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument("--backend-latency-ms", type=float, default=0.0,
+                        help="delay added to every fake Supabase/Prisma call")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="allowed relative regression, e.g. 0.5 for 50%%")
+    parser.add_argument("--slack-ms", type=float, default=1.0)
+    parser.add_argument("--lag-slack-ms", type=float, default=5.0)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results = bench(
+        args.scenarios, args.concurrency, args.requests, args.warmup,
+        args.backend_latency_ms / 1000,
+    )
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results, args.concurrency)
+
+    # Throughput and latency depend on both the core count and the concurrency
+    key = f"cpus={os.cpu_count()},concurrency={args.concurrency}"
+    stored = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    if args.update_baseline:
+        stored.setdefault(key, {}).update(
+            {name: {m: round(r[m], 3) for m in COMPARED_METRICS} for name, r in results.items()}
+        )
+        args.baseline.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
+        print(f"baseline written to {args.baseline}")
+        return
+
+    if key not in stored:
+        print(f"no baseline for {key} in {args.baseline}; skipping comparison")
+    regressions = compare(
+        results, stored.get(key, {}), args.tolerance, args.slack_ms, args.lag_slack_ms
+    )
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark bulk candidate import throughput.
+
+Generates CSV files of increasing size and runs them through
+``CandidateImporter`` against an in-memory table. Reports rows per second
+and peak traced memory, which should stay flat as the file grows.
+
+Usage:
+    poetry run python benchmarks/bench_candidate_import.py --rows 10000 100000
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+import tracemalloc
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+from api.services.candidate_import import CandidateImporter
+
+
+class CountingCandidateTable:
+    def __init__(self) -> None:
+        self.rows = 0
+        self.batches = 0
+
+    async def create_many(self, data, skip_duplicates=False):
+        self.rows += len(data)
+        self.batches += 1
+        return len(data)
+
+
+def write_csv(path: str, rows: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("first_name,last_name,email,phone,location,skills,career_level,years_experience\n")
+        for n in range(rows):
+            f.write(
+                f"Jane,Doe {n},candidate{n}@example.com,+1-555-{n % 10000:04d},"
+                f"Austin TX,python; sql; airflow,SENIOR,{n % 30}\n"
+            )
+
+
+async def run_import(path: str, batch_size: int) -> CountingCandidateTable:
+    table = CountingCandidateTable()
+
+    @asynccontextmanager
+    async def transaction():
+        yield SimpleNamespace(candidate=table)
+
+    importer = CandidateImporter("bench-tenant", batch_size=batch_size, transaction=transaction)
+    with open(path, "rb") as f:
+        async for _ in importer.run(f, "csv"):
+            pass
+    return table
+
+
+def bench(rows: int, batch_size: int) -> None:
+    with tempfile.NamedTemporaryFile(suffix=".csv") as tmp:
+        write_csv(tmp.name, rows)
+        started = time.perf_counter()
+        table = asyncio.run(run_import(tmp.name, batch_size))
+        elapsed = time.perf_counter() - started
+        # Measure memory in a second pass; tracing skews the timing above
+        tracemalloc.start()
+        asyncio.run(run_import(tmp.name, batch_size))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    assert table.rows == rows, f"imported {table.rows} of {rows} rows"
+    print(
+        f"rows={rows:>9,}  batch={batch_size:>5}  batches={table.batches:>6,}  "
+        f"elapsed={elapsed:7.2f}s  rows/s={rows / elapsed:>10,.0f}  "
+        f"peak_mem={peak / 1024 / 1024:6.1f} MiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 50_000])
+    parser.add_argument("--batch-size", type=int, nargs="+", default=[500])
+    args = parser.parse_args()
+
+    for batch_size in args.batch_size:
+        for rows in args.rows:
+            bench(rows, batch_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark keyset pagination against offset pagination.
+
+Loads a candidate table into SQLite with a ``(tenant_id, created_at, id)``
+index and fetches pages 1, 10, 100 and 1,000. Keyset pages go through
+``paginate``, which only seeks the index. Offset pages use LIMIT/OFFSET,
+which must scan every skipped row. Keyset page 1,000 should cost about
+the same as page 1.
+
+Usage:
+    poetry run python benchmarks/bench_pagination.py --rows 200000 --pages 1 10 100 1000
+"""
+
+import argparse
+import asyncio
+import sqlite3
+import statistics
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from api.db.pagination import encode_cursor, paginate
+
+SQL_OPERATORS = {"lt": "<", "lte": "<=", "gt": ">", "gte": ">="}
+TENANT = "bench-tenant"
+
+
+class SQLiteModel:
+    """Translates the Prisma query shapes used by ``paginate`` into SQL."""
+
+    def __init__(self, conn: sqlite3.Connection, table: str) -> None:
+        self.conn = conn
+        self.table = table
+
+    def _where(self, where: Optional[Dict[str, Any]]) -> Tuple[str, List[Any]]:
+        if not where:
+            return "1", []
+        clauses, params = [], []
+        for key, condition in where.items():
+            if key in ("AND", "OR"):
+                parts = [self._where(c) for c in condition]
+                clauses.append("(" + f" {key} ".join(sql for sql, _ in parts) + ")")
+                params.extend(p for _, part_params in parts for p in part_params)
+            elif isinstance(condition, dict):
+                for op, value in condition.items():
+                    clauses.append(f"{key} {SQL_OPERATORS[op]} ?")
+                    params.append(value)
+            else:
+                clauses.append(f"{key} = ?")
+                params.append(condition)
+        return "(" + " AND ".join(clauses) + ")", params
+
+    async def find_many(self, where=None, order=None, take=None, skip=None):
+        sql, params = self._where(where)
+        order_sql = ", ".join(f"{field} {direction}" for clause in order for field, direction in clause.items())
+        query = f"SELECT * FROM {self.table} WHERE {sql} ORDER BY {order_sql} LIMIT ? OFFSET ?"
+        cursor = self.conn.execute(query, [*params, take or -1, skip or 0])
+        return [dict(row) for row in cursor.fetchall()]
+
+
+def load(rows: int) -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute(
+        "CREATE TABLE candidate (id TEXT PRIMARY KEY, tenant_id TEXT, created_at INTEGER,"
+        " first_name TEXT, last_name TEXT, email TEXT, summary TEXT)"
+    )
+    conn.execute("CREATE INDEX candidate_keyset ON candidate (tenant_id, created_at, id)")
+    conn.executemany(
+        "INSERT INTO candidate VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (
+            (f"cand_{n:09d}", TENANT, 1_700_000_000 + n // 4, "Jane", f"Doe {n}",
+             f"candidate{n}@example.com", "Senior data engineer. " * 10)
+            for n in range(rows)
+        ),
+    )
+    conn.commit()
+    return conn
+
+
+def _timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def bench(rows: int, pages: List[int], page_size: int, repeat: int) -> None:
+    conn = load(rows)
+    model = SQLiteModel(conn, "candidate")
+    where = {"tenant_id": TENANT}
+    fields = {"id", "first_name", "last_name", "email"}
+    order = [{"created_at": "desc"}, {"id": "desc"}]
+
+    print(f"rows={rows:,}  page_size={page_size}")
+    print(f"{'page':>6}  {'keyset ms':>10}  {'offset ms':>10}")
+    for page_number in pages:
+        skip = (page_number - 1) * page_size
+        if skip >= rows:
+            print(f"{page_number:>6}  (beyond {rows:,} rows)")
+            continue
+        cursor = None
+        if skip:
+            # Position of the last row on the previous page, as a client would hold it
+            boundary = asyncio.run(model.find_many(where=where, order=order, take=1, skip=skip - 1))[0]
+            cursor = encode_cursor(boundary["created_at"], boundary["id"])
+
+        def keyset():
+            asyncio.run(paginate(model, where=where, limit=page_size, cursor=cursor, fields=fields))
+
+        def offset():
+            asyncio.run(model.find_many(where=where, order=order, take=page_size, skip=skip))
+
+        print(f"{page_number:>6}  {_timed(keyset, repeat):>10.3f}  {_timed(offset, repeat):>10.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    bench(args.rows, args.pages, args.page_size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+In-process stand-ins for the external services the API talks to.
+
+``FakePrisma`` mirrors the ``_ModelStub`` fallback in ``api.db.client`` but
+keeps rows in memory instead of raising, and ``FakeSupabase`` implements
+the auth calls made by ``AuthService``. Both can add a fixed latency to
+every call to approximate a network round trip.
+"""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+
+async def _delay(latency: float) -> None:
+    if latency:
+        await asyncio.sleep(latency)
+
+
+def _matches(row: Dict[str, Any], where: Dict[str, Any]) -> bool:
+    for key, condition in (where or {}).items():
+        if isinstance(condition, dict) and "in" in condition:
+            if row.get(key) not in condition["in"]:
+                return False
+        elif row.get(key) != condition:
+            return False
+    return True
+
+
+class FakeModel:
+    """In-memory model with the same methods as ``_ModelStub``."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.rows: Dict[str, Dict[str, Any]] = {}
+
+    async def find_unique(self, where: Dict[str, Any], **kwargs):
+        await _delay(self.latency)
+        row = self.rows.get(where.get("id"))
+        return SimpleNamespace(**row) if row else None
+
+    async def find_first(self, where: Dict[str, Any] = None, **kwargs):
+        rows = await self.find_many(where=where, take=1)
+        return rows[0] if rows else None
+
+    async def find_many(self, where: Dict[str, Any] = None, take: int = None, **kwargs):
+        await _delay(self.latency)
+        rows = [SimpleNamespace(**row) for row in self.rows.values() if _matches(row, where)]
+        return rows[:take] if take else rows
+
+    async def create(self, data: Dict[str, Any], **kwargs):
+        await _delay(self.latency)
+        row = {"id": uuid.uuid4().hex, **data}
+        self.rows[row["id"]] = row
+        return SimpleNamespace(**row)
+
+    async def create_many(self, data: List[Dict[str, Any]], **kwargs) -> int:
+        await _delay(self.latency)
+        for item in data:
+            row = {"id": uuid.uuid4().hex, **item}
+            self.rows[row["id"]] = row
+        return len(data)
+
+    async def update(self, where: Dict[str, Any], data: Dict[str, Any], **kwargs):
+        await _delay(self.latency)
+        row = self.rows.get(where.get("id"))
+        if row is None:
+            return None
+        row.update(data)
+        return SimpleNamespace(**row)
+
+    async def update_many(self, where: Dict[str, Any], data: Dict[str, Any], **kwargs) -> int:
+        await _delay(self.latency)
+        rows = [row for row in self.rows.values() if _matches(row, where)]
+        for row in rows:
+            row.update(data)
+        return len(rows)
+
+    async def delete(self, where: Dict[str, Any], **kwargs):
+        await _delay(self.latency)
+        row = self.rows.pop(where.get("id"), None)
+        return SimpleNamespace(**row) if row else None
+
+
+class FakePrisma:
+    """In-memory replacement for the generated Prisma client."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self._connected = False
+        self._models: Dict[str, FakeModel] = {}
+
+    async def connect(self) -> None:
+        self._connected = True
+
+    async def disconnect(self) -> None:
+        self._connected = False
+
+    def is_connected(self) -> bool:
+        return self._connected
+
+    async def query_raw(self, *args, **kwargs):
+        await _delay(self.latency)
+        return [{"?column?": 1}]
+
+    @asynccontextmanager
+    async def tx(self):
+        yield self
+
+    def __getattr__(self, name: str) -> FakeModel:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self._models.setdefault(name, FakeModel(self.latency))
+
+
+class FakeSupabaseAuth:
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.tokens: Dict[str, str] = {}
+
+    def add_user(self, email: str, password: str, tenant_id: str = "bench-tenant") -> None:
+        self.users[email] = {
+            "id": uuid.uuid4().hex,
+            "email": email,
+            "password": password,
+            "app_metadata": {"tenant_id": tenant_id},
+        }
+
+    def _session(self, email: str) -> SimpleNamespace:
+        token = uuid.uuid4().hex
+        self.tokens[token] = email
+        return SimpleNamespace(session=SimpleNamespace(access_token=token))
+
+    async def sign_in_with_password(self, credentials: Dict[str, str]):
+        await _delay(self.latency)
+        user = self.users.get(credentials["email"])
+        if user is None or user["password"] != credentials["password"]:
+            return SimpleNamespace(session=None)
+        return self._session(user["email"])
+
+    async def sign_up(self, credentials: Dict[str, Any]):
+        await _delay(self.latency)
+        self.add_user(credentials["email"], credentials["password"])
+        return self._session(credentials["email"])
+
+    async def get_user(self, token: str):
+        await _delay(self.latency)
+        email = self.tokens.get(token)
+        if email is None:
+            return None
+        user = {k: v for k, v in self.users[email].items() if k != "password"}
+        return SimpleNamespace(user=user)
+
+    async def sign_out(self) -> None:
+        await _delay(self.latency)
+
+
+class FakeSupabase:
+    """Replacement for the ``supabase.Client`` used by ``AuthService``."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.auth = FakeSupabaseAuth(latency)
@@ -0,0 +1,98 @@
+"""
+HTTP load generator for ``bench_api.py``, run as a separate process.
+
+Keeping the client out of the server's interpreter means the two don't
+compete for the GIL, so the numbers reflect what one API worker sustains.
+Only httpx is imported here; the app is never loaded in this process.
+
+The parent passes a JSON plan as the only argument and talks to the driver
+over stdin/stdout, one JSON object per line. For each scenario the driver
+runs the warmup, prints ``{"event": "ready"}`` and waits for a line on
+stdin before the measured run. That lets the parent reset its event-loop
+lag samples right before measuring. It then prints ``{"event": "result"}``
+with the scenario's statistics.
+"""
+
+import asyncio
+import json
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+import httpx
+
+
+def percentile(samples: List[float], pct: int) -> float:
+    if len(samples) < 2:
+        return samples[0] if samples else 0.0
+    return statistics.quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+
+def _request_kwargs(scenario: Dict[str, Any], token: str) -> Dict[str, Any]:
+    kwargs: Dict[str, Any] = {}
+    if scenario.get("data"):
+        kwargs["data"] = scenario["data"]
+    if scenario.get("auth"):
+        kwargs["headers"] = {"Authorization": f"Bearer {token}"}
+    return kwargs
+
+
+async def drive(
+    client: httpx.AsyncClient, scenario: Dict[str, Any], token: str, concurrency: int, requests: int
+) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = 0
+    remaining = requests
+    kwargs = _request_kwargs(scenario, token)
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                response = await client.request(scenario["method"], scenario["path"], **kwargs)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def _send(message: Dict[str, Any]) -> None:
+    sys.stdout.write(json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+async def run(plan: Dict[str, Any]) -> None:
+    concurrency = plan["concurrency"]
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=plan["base_url"], limits=limits, timeout=30) as client:
+        login = plan["login"]
+        response = await client.post(login["path"], data=login["data"])
+        response.raise_for_status()
+        token = response.json()["access_token"]
+
+        for scenario in plan["scenarios"]:
+            await drive(client, scenario, token, concurrency, plan["warmup"])
+            _send({"event": "ready", "scenario": scenario["name"]})
+            sys.stdin.readline()
+            result = await drive(client, scenario, token, concurrency, plan["requests"])
+            _send({"event": "result", "scenario": scenario["name"], **result})
+
+
+if __name__ == "__main__":
+    asyncio.run(run(json.loads(sys.argv[1])))
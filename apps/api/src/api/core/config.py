@@ -47,6 +47,25 @@ class Settings(BaseSettings):
     # LLM settings
     LLM_MODEL: str = Field(default="gpt-4o", description="LLM model to use")
     LLM_TEMPERATURE: float = 0.0
+    LLM_MAX_TOKENS: int = 1024
+    LLM_TIMEOUT_SECONDS: float = 60.0
+    LLM_MAX_CONNECTIONS: int = 20
+    OPENAI_BASE_URL: str = Field(
+        default="https://api.openai.com/v1", description="OpenAI API base URL"
+    )
+    ANTHROPIC_BASE_URL: str = Field(
+        default="https://api.anthropic.com/v1", description="Anthropic API base URL"
+    )
+
+    # LLM response cache
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_TTL_SECONDS: int = 60 * 60 * 24  # 1 day
+    LLM_CACHE_MAX_ENTRIES: int = 10_000
+    LLM_CACHE_PATH: str = Field(
+        default="", description="SQLite file for the LLM cache (in-memory if empty)"
+    )
+    LLM_CACHE_SIMILARITY_THRESHOLD: float = 0.95
+    LLM_CACHE_SEMANTIC_SCOPE_MAX_ENTRIES: int = 1_000  # per tenant, model and params
 
     # Document processing
     CHUNK_SIZE: int = 500
@@ -55,6 +74,14 @@ class Settings(BaseSettings):
     # Embedding model
     EMBEDDING_MODEL: str = "all-MiniLM-L6-v2"
 
+    # Bulk import
+    CANDIDATE_IMPORT_BATCH_SIZE: int = 500
+
+    # Background tasks
+    TASK_QUEUE_MAX_SIZE: int = 1000  # Per task type
+    TASK_DEFAULT_CONCURRENCY: int = 2
+    TASK_SHUTDOWN_TIMEOUT_SECONDS: float = 30.0
+
     # Crawling settings
     MAX_URLS_PER_PROJECT: int = 100
     MAX_WORKERS: int = 5
@@ -27,12 +27,18 @@ except Exception:  # pragma: no cover - fallback when Prisma isn't installed
         async def create(self, *args, **kwargs):
             raise NotImplementedError("Prisma model access is unavailable")
 
+        async def create_many(self, *args, **kwargs):
+            raise NotImplementedError("Prisma model access is unavailable")
+
         async def update(self, *args, **kwargs):
             raise NotImplementedError("Prisma model access is unavailable")
 
         async def update_many(self, *args, **kwargs):
             raise NotImplementedError("Prisma model access is unavailable")
 
+        async def delete(self, *args, **kwargs):
+            raise NotImplementedError("Prisma model access is unavailable")
+
     class Prisma:  # pragma: no cover - minimal stub
         def __init__(self) -> None:
             self._connected = False
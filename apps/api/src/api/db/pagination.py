@@ -0,0 +1,189 @@
+"""
+Keyset pagination module for Prisma list queries.
+
+Pages are addressed by an opaque cursor that encodes the sort key and id
+of the last row returned. The next page is fetched with a range predicate
+on ``(sort key, id)`` instead of an offset, so every page costs the same
+index seek no matter how deep into the result set it is.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class InvalidCursorError(ValueError):
+    """Exception raised when a pagination cursor cannot be decoded."""
+    pass
+
+
+class InvalidFieldsError(ValueError):
+    """Exception raised when a projection names unknown fields."""
+    pass
+
+
+@dataclass
+class Page:
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def encode_cursor(
+    sort_value: Any, record_id: str, sort_field: str = "created_at", descending: bool = True
+) -> str:
+    """
+    Encode a ``(sort key, id)`` position as an opaque URL-safe token.
+
+    The sort field and direction are part of the token, so a cursor can't be
+    replayed against a different ordering.
+    """
+    if isinstance(sort_value, datetime):
+        value = {"dt": sort_value.isoformat()}
+    else:
+        value = sort_value
+    direction = "desc" if descending else "asc"
+    raw = json.dumps([sort_field, direction, value, record_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(
+    cursor: str, sort_field: str = "created_at", descending: bool = True
+) -> Tuple[Any, str]:
+    """Decode a token produced by :func:`encode_cursor` for the given ordering."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        field, direction, value, record_id = json.loads(
+            base64.urlsafe_b64decode(padded.encode("ascii"))
+        )
+        value = _decode_sort_value(value)
+    except (binascii.Error, UnicodeError, ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+    if not isinstance(record_id, str):
+        raise InvalidCursorError("Invalid pagination cursor")
+    if (field, direction) != (sort_field, "desc" if descending else "asc"):
+        raise InvalidCursorError(
+            f"Cursor was issued for sort={field} {direction}; restart from the first page"
+        )
+    return value, record_id
+
+
+def _decode_sort_value(value: Any) -> Any:
+    # The value ends up in a Prisma ``where``, so only the shapes
+    # encode_cursor produces are accepted; anything else could be an operator
+    if isinstance(value, dict) and set(value) == {"dt"} and isinstance(value["dt"], str):
+        return datetime.fromisoformat(value["dt"])
+    if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+        return value
+    raise ValueError(f"Unsupported cursor sort value: {value!r}")
+
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str]) -> Optional[Set[str]]:
+    """
+    Parse a comma separated ``fields=`` projection.
+
+    Returns:
+        Optional[Set[str]]: The requested fields plus ``id``, or None for all
+    """
+    if not fields:
+        return None
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - set(allowed)
+    if unknown:
+        raise InvalidFieldsError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return requested | {"id"}
+
+
+def keyset_where(
+    sort_field: str, sort_value: Any, record_id: str, descending: bool
+) -> Dict[str, Any]:
+    """
+    Build the Prisma predicate selecting rows after ``(sort_value, record_id)``.
+
+    The leading inclusive bound on ``sort_field`` lets the database seek the
+    ``(sort_field, id)`` index to the cursor; the OR alone forces a scan.
+    """
+    op = "lt" if descending else "gt"
+    return {
+        "AND": [
+            {sort_field: {f"{op}e": sort_value}},
+            {"OR": [{sort_field: {op: sort_value}}, {"id": {op: record_id}}]},
+        ]
+    }
+
+
+def _to_dict(record: Any, fields: Optional[Set[str]]) -> Dict[str, Any]:
+    if hasattr(record, "model_dump"):
+        return record.model_dump(include=fields)
+    data = dict(record)
+    return data if fields is None else {k: v for k, v in data.items() if k in fields}
+
+
+def _get(record: Any, field: str) -> Any:
+    return record[field] if isinstance(record, dict) else getattr(record, field)
+
+
+async def paginate(
+    model: Any,
+    where: Optional[Dict[str, Any]] = None,
+    sort_field: str = "created_at",
+    descending: bool = True,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    fields: Optional[Set[str]] = None,
+) -> Page:
+    """
+    Fetch one page of ``model`` rows ordered by ``(sort_field, id)``.
+
+    Example:
+        async with get_database_connection() as db:
+            page = await paginate(db.candidate, where={"tenant_id": tenant_id}, cursor=cursor)
+
+    Args:
+        model: A Prisma model accessor such as ``db.candidate``
+        where: Base filter applied to every page
+        sort_field: Column to order by; ``id`` breaks ties
+        descending: Newest first when sorting by a timestamp
+        limit: Page size, capped at ``MAX_PAGE_SIZE``
+        cursor: ``next_cursor`` from the previous page
+        fields: Projection from :func:`parse_fields`; None serializes all fields
+
+    Returns:
+        Page: The rows of this page and the cursor of the next one
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    conditions = [where] if where else []
+    if cursor:
+        sort_value, record_id = decode_cursor(cursor, sort_field, descending)
+        conditions.append(keyset_where(sort_field, sort_value, record_id, descending))
+
+    direction = "desc" if descending else "asc"
+    if len(conditions) > 1:
+        query_where = {"AND": conditions}
+    else:
+        query_where = conditions[0] if conditions else None
+    records = await model.find_many(
+        where=query_where,
+        order=[{sort_field: direction}, {"id": direction}],
+        # One extra row tells us whether there is a next page
+        take=limit + 1,
+    )
+
+    next_cursor = None
+    if len(records) > limit:
+        records = records[:limit]
+        last = records[-1]
+        next_cursor = encode_cursor(
+            _get(last, sort_field), _get(last, "id"), sort_field, descending
+        )
+
+    return Page(items=[_to_dict(record, fields) for record in records], next_cursor=next_cursor)
@@ -9,6 +9,9 @@ from fastapi.openapi.utils import get_openapi
 from api.core.config import settings
 from api.routes.v1 import router as v1_router
 from api.services.auth import AuthService
+from api.services.llm import close_http_client
+from api.services.llm_cache import close_llm_cache
+from api.services.tasks import get_task_queue
 
 # Configure logging
 logging.basicConfig(
@@ -31,7 +34,12 @@ def start():
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan."""
+    task_queue = get_task_queue()
+    await task_queue.start()
     yield
+    await task_queue.stop()
+    await close_http_client()
+    await close_llm_cache()
 
 
 
@@ -58,6 +66,18 @@ app = FastAPI(
             "name": "users",
             "description": "Operations related to users."
         },
+        {
+            "name": "candidates",
+            "description": "Operations related to candidates."
+        },
+        {
+            "name": "chat",
+            "description": "Streaming chat completions."
+        },
+        {
+            "name": "tasks",
+            "description": "Background task status."
+        },
         # Add more tags as needed
     ],
     docs_url=f"{settings.API_V1_STR}/docs",
@@ -1,8 +1,14 @@
 from fastapi import APIRouter
 
 from api.routes.v1.auth import router as auth_router
+from api.routes.v1.candidates import router as candidates_router
+from api.routes.v1.chat import router as chat_router
+from api.routes.v1.tasks import router as tasks_router
 
 router = APIRouter()
 router.include_router(auth_router, prefix="/auth", tags=["auth"])
+router.include_router(candidates_router, prefix="/candidates", tags=["candidates"])
+router.include_router(chat_router, prefix="/chat", tags=["chat"])
+router.include_router(tasks_router, prefix="/tasks", tags=["tasks"])
 
 __all__ = ["router"]
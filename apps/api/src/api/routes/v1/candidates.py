@@ -0,0 +1,86 @@
+import io
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
+
+from api.core.config import settings
+from api.db.client import get_database_connection
+from api.db.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    InvalidCursorError,
+    InvalidFieldsError,
+    paginate,
+    parse_fields,
+)
+from api.schemas.candidate import CandidateResponse
+from api.schemas.pagination import PageResponse
+from api.services.auth import get_current_user, get_tenant_id
+from api.services.candidate_import import CandidateImporter, detect_format
+
+router = APIRouter()
+
+
+@router.get("", response_model=PageResponse)
+async def list_candidates(
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    sort: Literal["created_at", "updated_at"] = "created_at",
+    fields: Optional[str] = Query(default=None, description="Comma separated fields to return"),
+    user=Depends(get_current_user),
+):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    try:
+        # Never serialize columns outside the public response model
+        projection = parse_fields(fields, CandidateResponse.model_fields) or set(
+            CandidateResponse.model_fields
+        )
+        async with get_database_connection() as db:
+            page = await paginate(
+                db.candidate,
+                where={"tenant_id": get_tenant_id(user)},
+                sort_field=sort,
+                limit=limit,
+                cursor=cursor,
+                fields=projection,
+            )
+    except (InvalidCursorError, InvalidFieldsError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    return PageResponse(items=page.items, next_cursor=page.next_cursor, has_more=page.has_more)
+
+
+@router.post("/import")
+async def import_candidates(
+    file: UploadFile = File(...),
+    batch_size: int = Query(default=settings.CANDIDATE_IMPORT_BATCH_SIZE, ge=1, le=5000),
+    user=Depends(get_current_user),
+):
+    """Import candidates from a CSV or JSONL file, streaming NDJSON progress."""
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    fmt = detect_format(file.filename, file.content_type)
+    if fmt is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Upload a .csv or .jsonl file",
+        )
+
+    importer = CandidateImporter(get_tenant_id(user), batch_size=batch_size)
+    # FastAPI closes uploads as soon as the handler returns; keep the spooled
+    # file open for the streaming response and close it when the import ends.
+    upload, file.file = file.file, io.BytesIO()
+
+    async def progress_lines():
+        updates = importer.run(upload, fmt)
+        try:
+            async for progress in updates:
+                yield progress.model_dump_json() + "\n"
+        finally:
+            # Close the importer first; it waits for its reader thread to
+            # finish with the upload
+            await updates.aclose()
+            upload.close()
+
+    return StreamingResponse(progress_lines(), media_type="application/x-ndjson")
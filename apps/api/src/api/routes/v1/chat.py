@@ -0,0 +1,90 @@
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from api.core.config import settings
+from api.schemas.chat import ChatCompletionRequest, ChatCompletionResponse, ChatMessage
+from api.services.auth import get_current_user, get_tenant_id
+from api.services.llm import LLMError, LLMService, get_llm_service
+from api.services.llm_cache import get_llm_cache
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def _sse(data: str, event: str = "") -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {data}\n\n"
+
+
+async def _event_stream(
+    completion_id: str, model: str, tokens: AsyncIterator[str]
+) -> AsyncIterator[str]:
+    """Format provider tokens as Server-Sent Events.
+
+    Starlette cancels this generator as soon as the client disconnects, and
+    closing ``tokens`` closes the upstream provider connection with it.
+    """
+    try:
+        async for token in tokens:
+            yield _sse(json.dumps({"id": completion_id, "model": model, "content": token}))
+        yield _sse("[DONE]")
+    except LLMError as exc:
+        logger.error(f"Chat completion {completion_id} failed: {exc}")
+        yield _sse(json.dumps({"detail": str(exc)}), event="error")
+    except asyncio.CancelledError:
+        logger.info(f"Client disconnected; cancelled chat completion {completion_id}")
+        raise
+    finally:
+        await tokens.aclose()
+
+
+@router.post("/completions", response_model=ChatCompletionResponse)
+async def create_chat_completion(
+    data: ChatCompletionRequest,
+    user=Depends(get_current_user),
+    llm_service: LLMService = Depends(get_llm_service),
+):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+
+    completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+    model = data.model or settings.LLM_MODEL
+    tenant_id = get_tenant_id(user)
+
+    if data.stream:
+        tokens = llm_service.stream(
+            data.messages, model, data.temperature, data.max_tokens, tenant_id
+        )
+        return StreamingResponse(
+            _event_stream(completion_id, model, tokens),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    try:
+        content = await llm_service.complete(
+            data.messages, model, data.temperature, data.max_tokens, tenant_id
+        )
+    except LLMError as exc:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
+    return ChatCompletionResponse(
+        id=completion_id,
+        model=model,
+        message=ChatMessage(role="assistant", content=content),
+        created_at=int(time.time()),
+    )
+
+
+@router.get("/cache/stats")
+async def cache_stats(user=Depends(get_current_user)):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    return get_llm_cache().stats_for(get_tenant_id(user)).to_dict()
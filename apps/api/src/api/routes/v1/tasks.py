@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from api.schemas.task import TaskResponse
+from api.services.auth import get_current_user, get_tenant_id
+from api.services.tasks import TaskQueue, get_task_queue
+
+router = APIRouter()
+
+
+@router.get("/{task_id}", response_model=TaskResponse)
+async def get_task(
+    task_id: str,
+    user=Depends(get_current_user),
+    task_queue: TaskQueue = Depends(get_task_queue),
+):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    task = await task_queue.get(task_id)
+    # Tasks enqueued without a tenant are internal and never exposed here
+    if task is None or not task.tenant_id or task.tenant_id != get_tenant_id(user):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+    return TaskResponse(
+        id=task.id,
+        type=task.type,
+        key=task.key,
+        status=task.status,
+        priority=task.priority,
+        attempts=task.attempts,
+        error=task.error,
+        result=task.result,
+        created_at=task.created_at,
+        updated_at=task.updated_at,
+    )
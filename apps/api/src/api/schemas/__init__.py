@@ -13,6 +13,8 @@ from api.schemas.auth import (
 from api.schemas.candidate import (
     CandidateBase,
     CandidateCreate,
+    CandidateImportError,
+    CandidateImportProgress,
     CandidateResponse,
     CandidateSource,
     CandidateStatus,
@@ -36,7 +38,9 @@ from api.schemas.document import (
     DocumentURLUpload,
 )
 from api.schemas.job import JobBase, JobCreate, JobResponse, JobStatus
+from api.schemas.pagination import PageResponse
 from api.schemas.project import ProjectCreate, ProjectResponse
+from api.schemas.task import TaskResponse, TaskStatus
 from api.schemas.tenant import TenantCreate, TenantResponse
 
 __all__ = [
@@ -54,6 +58,8 @@ __all__ = [
     "CandidateBase",
     "CandidateCreate",
     "CandidateResponse",
+    "CandidateImportError",
+    "CandidateImportProgress",
     "CareerLevel",
     "EducationLevel",
     "CandidateStatus",
@@ -81,10 +87,17 @@ __all__ = [
     "JobResponse",
     "JobStatus",
 
+    # Pagination schemas
+    "PageResponse",
+
     # Project schemas
     "ProjectCreate",
     "ProjectResponse",
 
+    # Task schemas
+    "TaskResponse",
+    "TaskStatus",
+
     # Tenant schemas
     "TenantCreate",
     "TenantResponse",
@@ -0,0 +1,21 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class AgentBase(BaseModel):
+    name: str
+    description: Optional[str] = None
+    model: Optional[str] = None
+    system_prompt: Optional[str] = None
+
+
+class AgentCreate(AgentBase):
+    pass
+
+
+class AgentResponse(AgentBase):
+    id: str
+    tenant_id: str
+    created_at: int
+    updated_at: int
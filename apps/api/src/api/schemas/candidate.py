@@ -0,0 +1,85 @@
+from enum import Enum
+from typing import List, Optional
+
+from pydantic import BaseModel, EmailStr
+
+
+class CareerLevel(str, Enum):
+    ENTRY = "ENTRY"
+    JUNIOR = "JUNIOR"
+    MID = "MID"
+    SENIOR = "SENIOR"
+    LEAD = "LEAD"
+    EXECUTIVE = "EXECUTIVE"
+
+
+class EducationLevel(str, Enum):
+    HIGH_SCHOOL = "HIGH_SCHOOL"
+    ASSOCIATE = "ASSOCIATE"
+    BACHELOR = "BACHELOR"
+    MASTER = "MASTER"
+    DOCTORATE = "DOCTORATE"
+    OTHER = "OTHER"
+
+
+class CandidateStatus(str, Enum):
+    NEW = "NEW"
+    SCREENING = "SCREENING"
+    INTERVIEWING = "INTERVIEWING"
+    OFFERED = "OFFERED"
+    HIRED = "HIRED"
+    REJECTED = "REJECTED"
+    ARCHIVED = "ARCHIVED"
+
+
+class CandidateSource(str, Enum):
+    MANUAL = "MANUAL"
+    IMPORT = "IMPORT"
+    REFERRAL = "REFERRAL"
+    JOB_BOARD = "JOB_BOARD"
+    LINKEDIN = "LINKEDIN"
+    WEBSITE = "WEBSITE"
+    OTHER = "OTHER"
+
+
+class CandidateBase(BaseModel):
+    first_name: str
+    last_name: str
+    email: EmailStr
+    phone: Optional[str] = None
+    location: Optional[str] = None
+    headline: Optional[str] = None
+    summary: Optional[str] = None
+    skills: List[str] = []
+    years_experience: Optional[int] = None
+    career_level: Optional[CareerLevel] = None
+    education_level: Optional[EducationLevel] = None
+    status: CandidateStatus = CandidateStatus.NEW
+    source: CandidateSource = CandidateSource.MANUAL
+    linkedin_url: Optional[str] = None
+    resume_url: Optional[str] = None
+
+
+class CandidateCreate(CandidateBase):
+    pass
+
+
+class CandidateResponse(CandidateBase):
+    id: str
+    tenant_id: str
+    created_at: int
+    updated_at: int
+
+
+class CandidateImportError(BaseModel):
+    row: int
+    errors: List[str]
+
+
+class CandidateImportProgress(BaseModel):
+    processed: int = 0
+    imported: int = 0
+    skipped: int = 0
+    failed: int = 0
+    errors: List[CandidateImportError] = []
+    done: bool = False
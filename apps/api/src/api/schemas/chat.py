@@ -0,0 +1,54 @@
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+ChatRole = Literal["system", "user", "assistant"]
+
+
+class ChatMessage(BaseModel):
+    role: ChatRole
+    content: str
+
+
+class ChatMessageCreate(BaseModel):
+    session_id: str
+    role: ChatRole = "user"
+    content: str
+
+
+class ChatMessageResponse(BaseModel):
+    id: str
+    session_id: str
+    role: ChatRole
+    content: str
+    created_at: int
+
+
+class ChatSessionCreate(BaseModel):
+    title: Optional[str] = None
+    agent_id: Optional[str] = None
+
+
+class ChatSessionResponse(BaseModel):
+    id: str
+    title: Optional[str] = None
+    agent_id: Optional[str] = None
+    tenant_id: str
+    created_at: int
+    updated_at: int
+
+
+class ChatCompletionRequest(BaseModel):
+    messages: List[ChatMessage] = Field(..., min_length=1)
+    model: Optional[str] = None
+    temperature: Optional[float] = Field(default=None, ge=0.0, le=2.0)
+    max_tokens: Optional[int] = Field(default=None, gt=0)
+    stream: bool = True
+    session_id: Optional[str] = None
+
+
+class ChatCompletionResponse(BaseModel):
+    id: str
+    model: str
+    message: ChatMessage
+    created_at: int
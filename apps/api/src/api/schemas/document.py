@@ -0,0 +1,36 @@
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, HttpUrl
+
+
+class DocumentBase(BaseModel):
+    title: str
+    description: Optional[str] = None
+    content_type: Optional[str] = None
+
+
+class DocumentCreate(DocumentBase):
+    project_id: Optional[str] = None
+
+
+class DocumentURLUpload(BaseModel):
+    url: HttpUrl
+    title: Optional[str] = None
+    project_id: Optional[str] = None
+
+
+class DocumentResponse(DocumentBase):
+    id: str
+    tenant_id: str
+    project_id: Optional[str] = None
+    source_url: Optional[str] = None
+    created_at: int
+    updated_at: int
+
+
+class DocumentChunkResponse(BaseModel):
+    id: str
+    document_id: str
+    chunk_index: int
+    content: str
+    metadata: Dict[str, Any] = {}
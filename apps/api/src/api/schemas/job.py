@@ -0,0 +1,34 @@
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class JobStatus(str, Enum):
+    DRAFT = "DRAFT"
+    OPEN = "OPEN"
+    PAUSED = "PAUSED"
+    CLOSED = "CLOSED"
+    FILLED = "FILLED"
+
+
+class JobBase(BaseModel):
+    title: str
+    description: Optional[str] = None
+    department: Optional[str] = None
+    location: Optional[str] = None
+    employment_type: Optional[str] = None
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    status: JobStatus = JobStatus.DRAFT
+
+
+class JobCreate(JobBase):
+    pass
+
+
+class JobResponse(JobBase):
+    id: str
+    tenant_id: str
+    created_at: int
+    updated_at: int
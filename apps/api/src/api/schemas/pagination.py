@@ -0,0 +1,9 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class PageResponse(BaseModel):
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
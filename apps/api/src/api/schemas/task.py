@@ -0,0 +1,24 @@
+from enum import Enum
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+
+class TaskStatus(str, Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+
+class TaskResponse(BaseModel):
+    id: str
+    type: str
+    key: str
+    status: TaskStatus
+    priority: int
+    attempts: int
+    error: Optional[str] = None
+    result: Optional[Any] = None
+    created_at: int
+    updated_at: int
@@ -1,3 +1,18 @@
-from api.services.auth import AuthService, get_current_user
+from api.services.auth import AuthService, get_current_user, get_tenant_id
+from api.services.llm import LLMError, LLMService, get_llm_service
+from api.services.llm_cache import LLMCache, get_llm_cache
+from api.services.tasks import QueueFullError, TaskQueue, get_task_queue
 
-__all__ = ["AuthService", "get_current_user"]
+__all__ = [
+    "AuthService",
+    "get_current_user",
+    "get_tenant_id",
+    "LLMError",
+    "LLMService",
+    "get_llm_service",
+    "LLMCache",
+    "get_llm_cache",
+    "QueueFullError",
+    "TaskQueue",
+    "get_task_queue",
+]
@@ -107,3 +107,11 @@ async def get_current_user(
     auth_service: AuthService = Depends(get_auth_service),  # noqa: E501
 ):  # noqa: E501
     return await auth_service.get_current_user(token)  # noqa: E501
+
+
+def get_tenant_id(user) -> str:
+    """Resolve the tenant for an authenticated user, falling back to the user id."""
+    if isinstance(user, dict):
+        return str(user.get("tenant_id") or user.get("id") or "")
+    metadata = getattr(user, "app_metadata", None) or {}
+    return str(metadata.get("tenant_id") or getattr(user, "id", ""))
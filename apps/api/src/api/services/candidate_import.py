@@ -0,0 +1,265 @@
+"""
+Bulk candidate import module.
+
+This module streams CSV or JSONL uploads row by row, validates them in
+batches against ``CandidateCreate`` and writes each batch with a single
+multi-row insert. At most two batches are held in memory at a time (the
+one being inserted and the next one being parsed), so memory stays flat
+regardless of file size.
+"""
+
+import asyncio
+import codecs
+import csv
+import json
+import logging
+import threading
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import anyio
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+
+from api.core.config import settings
+from api.db.client import get_database_transaction
+from api.schemas.candidate import (
+    CandidateCreate,
+    CandidateImportError,
+    CandidateImportProgress,
+)
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_FORMATS = ("csv", "jsonl")
+LIST_FIELDS = ("skills",)
+
+RawRow = Tuple[int, Union[Dict[str, Any], Exception]]
+
+
+def detect_format(filename: Optional[str], content_type: Optional[str] = None) -> Optional[str]:
+    """Infer the upload format from its file name or content type."""
+    name = (filename or "").lower()
+    if name.endswith(".csv") or content_type == "text/csv":
+        return "csv"
+    if name.endswith((".jsonl", ".ndjson")) or content_type in (
+        "application/jsonl",
+        "application/x-ndjson",
+    ):
+        return "jsonl"
+    return None
+
+
+def read_rows(file: BinaryIO, fmt: str) -> Iterator[RawRow]:
+    """
+    Lazily yield ``(row_number, row)`` pairs from an uploaded file.
+
+    Each line is decoded on its own, so a stray non-UTF-8 byte only fails
+    the row it belongs to. Rows that cannot be decoded or parsed are
+    yielded as exceptions so they can be reported without stopping the
+    import.
+    """
+    bad_lines: Set[int] = set()
+    lines = _decode_lines(file, bad_lines)
+    if fmt == "csv":
+        yield from _read_csv_rows(lines, bad_lines)
+        return
+
+    for row_number, line in enumerate(lines, start=1):
+        if row_number in bad_lines:
+            bad_lines.discard(row_number)
+            yield row_number, ValueError("Line is not valid UTF-8")
+            continue
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield row_number, e
+            continue
+        if not isinstance(row, dict):
+            yield row_number, ValueError("Expected a JSON object")
+            continue
+        yield row_number, row
+
+
+def _decode_lines(file: BinaryIO, bad_lines: Set[int]) -> Iterator[str]:
+    """Decode ``file`` line by line, recording the numbers of undecodable lines."""
+    for line_number, raw in enumerate(file, start=1):
+        if line_number == 1 and raw.startswith(codecs.BOM_UTF8):
+            raw = raw[len(codecs.BOM_UTF8):]
+        try:
+            yield raw.decode("utf-8")
+        except UnicodeDecodeError:
+            bad_lines.add(line_number)
+            yield raw.decode("utf-8", errors="replace")
+
+
+def _read_csv_rows(lines: Iterator[str], bad_lines: Set[int]) -> Iterator[RawRow]:
+    reader = csv.reader(lines)
+    try:
+        header = next(reader)
+    except (StopIteration, csv.Error):
+        return
+    header = [column.strip() for column in header]
+
+    # Row 1 is the header; a quoted field may span several physical lines
+    row_number, first_line = 1, reader.line_num + 1
+    while True:
+        try:
+            values = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            row_number += 1
+            bad_lines.difference_update(range(first_line, reader.line_num + 1))
+            first_line = reader.line_num + 1
+            yield row_number, ValueError(f"Malformed CSV row: {e}")
+            continue
+        record_lines = set(range(first_line, reader.line_num + 1))
+        first_line = reader.line_num + 1
+        if not values:
+            continue
+        row_number += 1
+        if record_lines & bad_lines:
+            bad_lines.difference_update(record_lines)
+            yield row_number, ValueError("Row is not valid UTF-8")
+            continue
+        if len(values) != len(header):
+            yield row_number, ValueError(
+                f"Row has {len(values)} fields, expected {len(header)} from the header"
+            )
+            continue
+        yield row_number, _normalize_csv_row(dict(zip(header, values)))
+
+
+def _normalize_csv_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    normalized = {}
+    for column, value in row.items():
+        value = value.strip()
+        if not value:
+            continue
+        if column in LIST_FIELDS:
+            value = [item.strip() for item in value.replace(";", ",").split(",") if item.strip()]
+        normalized[column] = value
+    return normalized
+
+
+def validate_batch(
+    rows: List[RawRow],
+) -> Tuple[List[Tuple[int, CandidateCreate]], List[CandidateImportError]]:
+    """Split a batch of raw rows into valid candidates and per-row errors."""
+    valid, errors = [], []
+    for row_number, row in rows:
+        if isinstance(row, Exception):
+            errors.append(CandidateImportError(row=row_number, errors=[str(row)]))
+            continue
+        try:
+            valid.append((row_number, CandidateCreate.model_validate(row)))
+        except ValidationError as e:
+            messages = [
+                f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+                for error in e.errors()
+            ]
+            errors.append(CandidateImportError(row=row_number, errors=messages))
+    return valid, errors
+
+
+def _next_batch(rows: Iterator[RawRow], batch_size: int, stop: threading.Event):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size or stop.is_set():
+            break
+    if stop.is_set():
+        return [], ([], [])
+    return batch, validate_batch(batch)
+
+
+class CandidateImporter:
+    """Imports candidates for a tenant in batched multi-row inserts."""
+
+    def __init__(self, tenant_id: str, batch_size: Optional[int] = None, transaction=None) -> None:
+        self.tenant_id = tenant_id
+        self.batch_size = batch_size or settings.CANDIDATE_IMPORT_BATCH_SIZE
+        self.transaction = transaction or get_database_transaction
+
+    async def run(self, file: BinaryIO, fmt: str) -> AsyncIterator[CandidateImportProgress]:
+        """
+        Import every row of ``file`` and yield progress after each batch.
+
+        Each progress update carries the row errors of that batch only, and
+        the last update has ``done`` set with the final totals. Rows that
+        duplicate an existing candidate are counted as skipped. A failed
+        insert marks that batch's rows as failed and the import continues.
+        """
+        if fmt not in SUPPORTED_FORMATS:
+            raise ValueError(f"Unsupported import format: {fmt}")
+
+        rows = read_rows(file, fmt)
+        stop = threading.Event()
+        progress = CandidateImportProgress()
+        # Parsing and validation are CPU bound, so they run in a worker thread,
+        # one batch ahead of the insert that is awaiting the database
+        prefetch = asyncio.ensure_future(
+            run_in_threadpool(_next_batch, rows, self.batch_size, stop)
+        )
+        try:
+            while True:
+                batch, (valid, errors) = await prefetch
+                if not batch:
+                    break
+                prefetch = asyncio.ensure_future(
+                    run_in_threadpool(_next_batch, rows, self.batch_size, stop)
+                )
+                if valid:
+                    try:
+                        inserted = await self._insert(valid)
+                        progress.imported += inserted
+                        progress.skipped += len(valid) - inserted
+                    except Exception as e:
+                        logger.error(
+                            f"Candidate import batch failed for tenant {self.tenant_id}: {e}"
+                        )
+                        errors.extend(
+                            CandidateImportError(row=row_number, errors=[f"Database error: {e}"])
+                            for row_number, _ in valid
+                        )
+                progress.processed += len(batch)
+                progress.failed += len(errors)
+                progress.errors = errors
+                yield progress.model_copy()
+        finally:
+            # A thread can't be interrupted: ask the reader to stop and wait
+            # until it has let go of ``file`` so the caller can close it
+            stop.set()
+            with anyio.CancelScope(shield=True):
+                await asyncio.gather(prefetch, return_exceptions=True)
+
+        progress.errors = []
+        progress.done = True
+        logger.info(
+            f"Imported {progress.imported}/{progress.processed} candidates "
+            f"for tenant {self.tenant_id}"
+        )
+        yield progress
+
+    async def _insert(self, candidates: List[Tuple[int, CandidateCreate]]) -> int:
+        data = [
+            {**candidate.model_dump(mode="json"), "tenant_id": self.tenant_id}
+            for _, candidate in candidates
+        ]
+        async with self.transaction() as tx:
+            result = await tx.candidate.create_many(data=data, skip_duplicates=True)
+        # Prisma returns the inserted row count; duplicates are skipped
+        return result if isinstance(result, int) else len(data)
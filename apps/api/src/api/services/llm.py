@@ -0,0 +1,226 @@
+"""
+LLM provider client module.
+
+This module streams chat completions from OpenAI and Anthropic over a
+single pooled HTTP client so connections are reused across requests.
+"""
+
+import json
+import logging
+import time
+from typing import AsyncIterator, List, Optional, Tuple
+
+import httpx
+
+from api.core.config import settings
+from api.schemas.chat import ChatMessage
+from api.services.llm_cache import LLMCache, get_llm_cache
+
+logger = logging.getLogger(__name__)
+
+ANTHROPIC_VERSION = "2023-06-01"
+
+# Global pooled HTTP client instance
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client used for provider calls.
+
+    Returns:
+        httpx.AsyncClient: A pooled client with keep-alive connections
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.LLM_TIMEOUT_SECONDS, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=settings.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_MAX_CONNECTIONS,
+            ),
+        )
+        logger.debug("Created new LLM HTTP client")
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared HTTP client.
+
+    This should be called during application shutdown.
+    """
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+        logger.info("Closed LLM HTTP client")
+    _http_client = None
+
+
+class LLMError(Exception):
+    """Exception raised when the LLM provider returns an error."""
+    pass
+
+
+class LLMService:
+    """Chat completion service for the configured LLM providers."""
+
+    def __init__(
+        self, client: Optional[httpx.AsyncClient] = None, cache: Optional[LLMCache] = None
+    ) -> None:
+        self._client = client
+        self.cache = cache
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client or get_http_client()
+
+    @staticmethod
+    def is_anthropic_model(model: str) -> bool:
+        return model.startswith("claude")
+
+    async def stream(
+        self,
+        messages: List[ChatMessage],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        tenant_id: str = "",
+    ) -> AsyncIterator[str]:
+        """
+        Stream completion tokens as they arrive from the provider.
+
+        Tokens are pulled from the upstream response only as fast as the
+        caller consumes them. Closing or cancelling the iterator closes the
+        upstream connection, which stops generation on the provider side.
+
+        Deterministic (temperature 0) completions are served from and stored
+        in the cache when one is configured. A cache hit is yielded as a
+        single chunk, and only fully streamed completions are stored.
+
+        Yields:
+            str: Each text delta returned by the provider
+        """
+        model = model or settings.LLM_MODEL
+        temperature = settings.LLM_TEMPERATURE if temperature is None else temperature
+        max_tokens = max_tokens or settings.LLM_MAX_TOKENS
+        params = {"temperature": temperature, "max_tokens": max_tokens}
+
+        use_cache = self.cache is not None and temperature == 0
+        if use_cache:
+            cached = await self.cache.get(tenant_id, model, messages, params)
+            if cached is not None:
+                yield cached
+                return
+
+        started = time.perf_counter()
+        chunks = []
+        async for token in self._stream_upstream(messages, model, temperature, max_tokens):
+            chunks.append(token)
+            yield token
+
+        if use_cache:
+            latency = time.perf_counter() - started
+            await self.cache.set(tenant_id, model, messages, params, "".join(chunks), latency)
+
+    async def _stream_upstream(
+        self, messages: List[ChatMessage], model: str, temperature: float, max_tokens: int
+    ) -> AsyncIterator[str]:
+        if self.is_anthropic_model(model):
+            url, headers, payload = self._anthropic_request(messages, model, temperature, max_tokens)
+            parse = self._parse_anthropic_event
+        else:
+            url, headers, payload = self._openai_request(messages, model, temperature, max_tokens)
+            parse = self._parse_openai_event
+
+        try:
+            async with self.client.stream("POST", url, headers=headers, json=payload) as response:
+                if response.status_code >= 400:
+                    detail = (await response.aread()).decode("utf-8", errors="replace")
+                    raise LLMError(f"{model} request failed ({response.status_code}): {detail}")
+
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    try:
+                        event = json.loads(data)
+                    except ValueError as exc:
+                        raise LLMError(f"{model} sent a malformed event: {data[:200]}") from exc
+                    token = parse(event)
+                    if token:
+                        yield token
+        except httpx.HTTPError as exc:
+            raise LLMError(f"{model} request failed: {exc}") from exc
+
+    async def complete(
+        self,
+        messages: List[ChatMessage],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        tenant_id: str = "",
+    ) -> str:
+        """Return the full completion text for the given messages."""
+        tokens = [
+            token
+            async for token in self.stream(messages, model, temperature, max_tokens, tenant_id)
+        ]
+        return "".join(tokens)
+
+    def _openai_request(
+        self, messages: List[ChatMessage], model: str, temperature: float, max_tokens: int
+    ) -> Tuple[str, dict, dict]:
+        url = f"{settings.OPENAI_BASE_URL.rstrip('/')}/chat/completions"
+        headers = {"Authorization": f"Bearer {settings.OPENAI_API_KEY}"}
+        payload = {
+            "model": model,
+            "messages": [message.model_dump() for message in messages],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True,
+        }
+        return url, headers, payload
+
+    def _anthropic_request(
+        self, messages: List[ChatMessage], model: str, temperature: float, max_tokens: int
+    ) -> Tuple[str, dict, dict]:
+        url = f"{settings.ANTHROPIC_BASE_URL.rstrip('/')}/messages"
+        headers = {
+            "x-api-key": settings.ANTHROPIC_API_KEY,
+            "anthropic-version": ANTHROPIC_VERSION,
+        }
+        system = "\n\n".join(m.content for m in messages if m.role == "system")
+        payload = {
+            "model": model,
+            "messages": [m.model_dump() for m in messages if m.role != "system"],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True,
+        }
+        if system:
+            payload["system"] = system
+        return url, headers, payload
+
+    @staticmethod
+    def _parse_openai_event(event: dict) -> Optional[str]:
+        if "error" in event:
+            raise LLMError(str(event["error"]))
+        choices = event.get("choices") or []
+        if not choices:
+            return None
+        return (choices[0].get("delta") or {}).get("content")
+
+    @staticmethod
+    def _parse_anthropic_event(event: dict) -> Optional[str]:
+        if event.get("type") == "error":
+            raise LLMError(str(event.get("error")))
+        if event.get("type") != "content_block_delta":
+            return None
+        return (event.get("delta") or {}).get("text")
+
+
+def get_llm_service() -> LLMService:
+    return LLMService(cache=get_llm_cache() if settings.LLM_CACHE_ENABLED else None)
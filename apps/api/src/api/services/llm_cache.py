@@ -0,0 +1,491 @@
+"""
+LLM response cache module.
+
+This module caches deterministic chat completions so identical prompts
+(summarizing the same resume, screening against the same job) are only
+paid for once. Entries are isolated per tenant.
+
+The exact tier is keyed by a hash of tenant, model, messages and
+parameters. The optional semantic tier embeds the prompt and reuses an
+exact entry when a previous prompt is similar enough.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from starlette.concurrency import run_in_threadpool
+
+from api.core.config import settings
+from api.schemas.chat import ChatMessage
+
+logger = logging.getLogger(__name__)
+
+Embedder = Callable[[str], Awaitable[Sequence[float]]]
+
+
+@dataclass
+class CacheEntry:
+    value: str
+    expires_at: float
+    latency: float = 0.0
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    semantic_hits: int = 0
+    misses: int = 0
+    latency_saved_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+class MemoryCacheBackend:
+    """In-process LRU backend."""
+
+    blocking = False
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteCacheBackend:
+    """Durable on-disk LRU backend stored in a SQLite file.
+
+    Calls block on disk I/O, so ``LLMCache`` runs them in the threadpool.
+    Reads only queue their access time; the queue is written in the same
+    transaction as the next ``set`` (or once it grows past
+    ``TOUCH_BATCH_SIZE``), so a lookup never waits on a commit.
+
+    The row count used for eviction is kept in the file by triggers, so
+    several worker processes can share one cache file.
+    """
+
+    blocking = True
+    TOUCH_BATCH_SIZE = 256
+
+    def __init__(self, path: str, max_entries: int) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._touched: Dict[str, float] = {}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL keeps the file consistent without a sync per commit; losing the
+        # last few cache writes on power loss is acceptable
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " latency REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS llm_cache_accessed_at ON llm_cache (accessed_at)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache_size ("
+            " id INTEGER PRIMARY KEY CHECK (id = 0),"
+            " entries INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS llm_cache_count_insert AFTER INSERT ON llm_cache"
+            " BEGIN UPDATE llm_cache_size SET entries = entries + 1 WHERE id = 0; END"
+        )
+        self._conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS llm_cache_count_delete AFTER DELETE ON llm_cache"
+            " BEGIN UPDATE llm_cache_size SET entries = entries - 1 WHERE id = 0; END"
+        )
+        # Seeded after the triggers exist so rows written meanwhile by another
+        # process are counted exactly once
+        self._conn.execute(
+            "INSERT OR IGNORE INTO llm_cache_size (id, entries)"
+            " SELECT 0, COUNT(*) FROM llm_cache"
+        )
+        self._conn.commit()
+
+    def _size(self) -> int:
+        (entries,) = self._conn.execute(
+            "SELECT entries FROM llm_cache_size WHERE id = 0"
+        ).fetchone()
+        return entries
+
+    def _flush_touched(self) -> None:
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE llm_cache SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at, latency FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            # Expired rows are left for the purge in ``set``
+            if row is None or row[1] <= now:
+                return None
+            self._touched[key] = now
+            if len(self._touched) >= self.TOUCH_BATCH_SIZE:
+                self._flush_touched()
+                self._conn.commit()
+        return CacheEntry(value=row[0], expires_at=row[1], latency=row[2])
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        now = time.time()
+        with self._lock:
+            try:
+                self._touched.pop(key, None)
+                self._flush_touched()
+                updated = self._conn.execute(
+                    "UPDATE llm_cache SET value = ?, expires_at = ?, latency = ?, accessed_at = ?"
+                    " WHERE key = ?",
+                    (entry.value, entry.expires_at, entry.latency, now, key),
+                )
+                if updated.rowcount == 0:
+                    self._conn.execute(
+                        "INSERT INTO llm_cache (key, value, expires_at, latency, accessed_at)"
+                        " VALUES (?, ?, ?, ?, ?)",
+                        (key, entry.value, entry.expires_at, entry.latency, now),
+                    )
+                if self._size() > self.max_entries:
+                    self._conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+                excess = self._size() - self.max_entries
+                if excess > 0:
+                    self._conn.execute(
+                        "DELETE FROM llm_cache WHERE key IN"
+                        " (SELECT key FROM llm_cache ORDER BY accessed_at, rowid LIMIT ?)",
+                        (excess,),
+                    )
+                self._conn.commit()
+            except sqlite3.Error:
+                # Leave the connection usable for the next call
+                self._conn.rollback()
+                raise
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._touched.pop(key, None)
+            self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._touched.clear()
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touched()
+            self._conn.commit()
+            self._conn.close()
+
+
+class EmbeddingIndex:
+    """Bounded in-memory vector index mapping prompt embeddings to cache keys.
+
+    Vectors are grouped by scope (tenant, model and parameters) and each
+    scope holds at most ``max_entries_per_scope`` of them, so a search only
+    scans the caller's own entries. ``search`` is safe to call from a worker
+    thread: it copies a per-scope matrix under the lock and scores it with
+    a single matrix-vector product outside it.
+    """
+
+    def __init__(self, max_entries: int, max_entries_per_scope: Optional[int] = None) -> None:
+        self.max_entries = max_entries
+        self.max_entries_per_scope = min(max_entries_per_scope or max_entries, max_entries)
+        self._lock = threading.Lock()
+        self._scopes: Dict[str, "OrderedDict[str, np.ndarray]"] = {}
+        self._order: "OrderedDict[str, str]" = OrderedDict()
+        self._matrices: Dict[str, Tuple[List[str], np.ndarray]] = {}
+
+    def add(self, scope: str, key: str, vector: Sequence[float]) -> None:
+        normalized = _normalize(vector)
+        with self._lock:
+            self._discard(key)
+            entries = self._scopes.setdefault(scope, OrderedDict())
+            entries[key] = normalized
+            self._order[key] = scope
+            self._matrices.pop(scope, None)
+            while len(entries) > self.max_entries_per_scope:
+                self._discard(next(iter(entries)))
+            while len(self._order) > self.max_entries:
+                self._discard(next(iter(self._order)))
+
+    def search(self, scope: str, vector: Sequence[float]) -> Tuple[Optional[str], float]:
+        with self._lock:
+            snapshot = self._matrices.get(scope)
+            if snapshot is None:
+                entries = self._scopes.get(scope)
+                if not entries:
+                    return None, -1.0
+                snapshot = (list(entries), np.vstack(list(entries.values())))
+                self._matrices[scope] = snapshot
+        keys, matrix = snapshot
+        scores = matrix @ _normalize(vector)
+        best = int(np.argmax(scores))
+        return keys[best], float(scores[best])
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            self._discard(key)
+
+    def _discard(self, key: str) -> None:
+        scope = self._order.pop(key, None)
+        if scope is None:
+            return
+        entries = self._scopes[scope]
+        del entries[key]
+        if not entries:
+            del self._scopes[scope]
+        self._matrices.pop(scope, None)
+
+
+def _normalize(vector: Sequence[float]) -> np.ndarray:
+    array = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(array)) or 1.0
+    return array / norm
+
+
+def _digest(payload: Any) -> str:
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """Two-tier (exact and semantic) cache for chat completions."""
+
+    def __init__(
+        self,
+        backend=None,
+        ttl_seconds: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        embed: Optional[Embedder] = None,
+        similarity_threshold: Optional[float] = None,
+    ) -> None:
+        self.max_entries = max_entries or settings.LLM_CACHE_MAX_ENTRIES
+        self.ttl_seconds = ttl_seconds or settings.LLM_CACHE_TTL_SECONDS
+        self.backend = backend or MemoryCacheBackend(self.max_entries)
+        self.embed = embed
+        self.similarity_threshold = (
+            settings.LLM_CACHE_SIMILARITY_THRESHOLD
+            if similarity_threshold is None
+            else similarity_threshold
+        )
+        self.index = (
+            EmbeddingIndex(self.max_entries, settings.LLM_CACHE_SEMANTIC_SCOPE_MAX_ENTRIES)
+            if embed
+            else None
+        )
+        # Process-wide totals; callers only ever see their own tenant's stats
+        self.stats = CacheStats()
+        self._tenant_stats: Dict[str, CacheStats] = {}
+
+    def stats_for(self, tenant_id: str) -> CacheStats:
+        """Return the cache statistics of a single tenant."""
+        return self._tenant_stats.get(tenant_id) or CacheStats()
+
+    def _counters(self, tenant_id: str) -> Tuple[CacheStats, CacheStats]:
+        return self.stats, self._tenant_stats.setdefault(tenant_id, CacheStats())
+
+    async def _backend(self, method: str, *args: Any) -> Any:
+        call = getattr(self.backend, method)
+        if getattr(self.backend, "blocking", False):
+            return await run_in_threadpool(call, *args)
+        return call(*args)
+
+    @staticmethod
+    def make_key(
+        tenant_id: str, model: str, messages: List[ChatMessage], params: Dict[str, Any]
+    ) -> str:
+        return _digest(
+            {
+                "tenant_id": tenant_id,
+                "model": model,
+                "messages": [m.model_dump() for m in messages],
+                "params": params,
+            }
+        )
+
+    @staticmethod
+    def _semantic_scope(tenant_id: str, model: str, params: Dict[str, Any]) -> str:
+        return _digest({"tenant_id": tenant_id, "model": model, "params": params})
+
+    @staticmethod
+    def _prompt_text(messages: List[ChatMessage]) -> str:
+        return "\n".join(f"{m.role}: {m.content}" for m in messages)
+
+    async def get(
+        self,
+        tenant_id: str,
+        model: str,
+        messages: List[ChatMessage],
+        params: Dict[str, Any],
+    ) -> Optional[str]:
+        """
+        Return a cached completion, or None on a miss.
+
+        A failing backend (e.g. a locked or full SQLite file) is logged and
+        counted as a miss so the completion still goes to the provider.
+        """
+        try:
+            entry = await self._backend("get", self.make_key(tenant_id, model, messages, params))
+        except Exception as e:
+            logger.warning(f"LLM cache lookup failed: {e}")
+            entry = None
+        if entry is None and self.index is not None:
+            entry = await self._get_semantic(tenant_id, model, messages, params)
+        for stats in self._counters(tenant_id):
+            if entry is None:
+                stats.misses += 1
+            else:
+                stats.hits += 1
+                stats.latency_saved_seconds += entry.latency
+        return entry.value if entry is not None else None
+
+    async def _get_semantic(
+        self,
+        tenant_id: str,
+        model: str,
+        messages: List[ChatMessage],
+        params: Dict[str, Any],
+    ) -> Optional[CacheEntry]:
+        try:
+            vector = await self.embed(self._prompt_text(messages))
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+        scope = self._semantic_scope(tenant_id, model, params)
+        key, score = await run_in_threadpool(self.index.search, scope, vector)
+        if key is None or score < self.similarity_threshold:
+            return None
+        try:
+            entry = await self._backend("get", key)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+        if entry is None:
+            self.index.remove(key)
+            return None
+        for stats in self._counters(tenant_id):
+            stats.semantic_hits += 1
+        logger.debug(f"Semantic cache hit (similarity {score:.3f})")
+        return entry
+
+    async def set(
+        self,
+        tenant_id: str,
+        model: str,
+        messages: List[ChatMessage],
+        params: Dict[str, Any],
+        value: str,
+        latency: float = 0.0,
+    ) -> None:
+        """
+        Store a completion and, if enabled, index its prompt embedding.
+
+        Backend errors are logged and the write is skipped; the caller has
+        already received the completion.
+        """
+        key = self.make_key(tenant_id, model, messages, params)
+        entry = CacheEntry(value=value, expires_at=time.time() + self.ttl_seconds, latency=latency)
+        try:
+            await self._backend("set", key, entry)
+        except Exception as e:
+            logger.warning(f"Failed to store cached completion: {e}")
+            return
+        if self.index is None:
+            return
+        try:
+            vector = await self.embed(self._prompt_text(messages))
+        except Exception as e:
+            logger.warning(f"Failed to index cached completion: {e}")
+            return
+        self.index.add(self._semantic_scope(tenant_id, model, params), key, vector)
+
+    async def close(self) -> None:
+        """Flush pending writes and release the backend."""
+        await self._backend("close")
+
+    def clear(self) -> None:
+        self.backend.clear()
+        if self.index is not None:
+            self.index = EmbeddingIndex(self.max_entries, self.index.max_entries_per_scope)
+        self.stats = CacheStats()
+        self._tenant_stats.clear()
+
+
+@lru_cache()
+def get_llm_cache() -> LLMCache:
+    """
+    Get a singleton instance of the LLM cache.
+
+    Uses the SQLite backend when ``LLM_CACHE_PATH`` is set, otherwise an
+    in-memory LRU.
+
+    Returns:
+        LLMCache: The shared cache instance
+    """
+    backend = None
+    if settings.LLM_CACHE_PATH:
+        backend = SQLiteCacheBackend(settings.LLM_CACHE_PATH, settings.LLM_CACHE_MAX_ENTRIES)
+        logger.info(f"Using on-disk LLM cache at {settings.LLM_CACHE_PATH}")
+    return LLMCache(backend=backend)
+
+
+async def close_llm_cache() -> None:
+    """
+    Close the shared LLM cache if it was created.
+
+    This should be called during application shutdown so queued SQLite
+    access times are written.
+    """
+    if get_llm_cache.cache_info().currsize:
+        await get_llm_cache().close()
+        get_llm_cache.cache_clear()
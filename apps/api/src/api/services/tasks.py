@@ -0,0 +1,380 @@
+"""
+Background task queue module.
+
+This module runs heavy work (document parsing, embedding, crawling,
+match scoring) outside request handlers on an in-process scheduler that
+is started and drained by the application lifespan.
+
+Each task type has its own priority queue and a bounded pool of workers.
+Enqueueing blocks (or fails fast) when a queue is full, and submissions
+with the same key collapse onto the task that is already queued or
+running. Tasks are persisted through Prisma so queued work survives a
+restart. This expects a ``BackgroundTask`` model with the fields of
+:class:`Task`.
+"""
+
+import asyncio
+import hashlib
+import itertools
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from api.core.config import settings
+from api.db.client import get_database_connection, get_database_transaction
+from api.schemas.task import TaskStatus
+
+logger = logging.getLogger(__name__)
+
+TaskHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+ACTIVE_STATUSES = (TaskStatus.QUEUED, TaskStatus.RUNNING)
+MAX_FINISHED_TASKS = 10_000
+
+
+@dataclass
+class Task:
+    type: str
+    key: str
+    payload: Dict[str, Any]
+    priority: int = 0
+    tenant_id: Optional[str] = None
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: TaskStatus = TaskStatus.QUEUED
+    attempts: int = 0
+    error: Optional[str] = None
+    result: Optional[Any] = None
+    created_at: int = field(default_factory=lambda: int(time.time()))
+    updated_at: int = field(default_factory=lambda: int(time.time()))
+
+    def to_record(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "type": self.type,
+            "key": self.key,
+            "payload": json.dumps(self.payload),
+            "priority": self.priority,
+            "tenant_id": self.tenant_id,
+            "status": self.status.value,
+            "attempts": self.attempts,
+            "error": self.error,
+            "result": None if self.result is None else json.dumps(self.result),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_record(cls, record: Any) -> "Task":
+        return cls(
+            id=record.id,
+            type=record.type,
+            key=record.key,
+            payload=json.loads(record.payload),
+            priority=record.priority,
+            tenant_id=record.tenant_id,
+            status=TaskStatus(record.status),
+            attempts=record.attempts,
+            error=record.error,
+            result=None if record.result is None else json.loads(record.result),
+            created_at=record.created_at,
+            updated_at=record.updated_at,
+        )
+
+
+class QueueFullError(Exception):
+    """Exception raised when a task queue has no room for new work."""
+    pass
+
+
+class TaskStore:
+    """Persists tasks through the Prisma client."""
+
+    async def create(self, task: Task) -> None:
+        async with get_database_transaction() as tx:
+            await tx.backgroundtask.create(data=task.to_record())
+
+    async def update(self, task: Task) -> None:
+        record = task.to_record()
+        task_id = record.pop("id")
+        async with get_database_transaction() as tx:
+            await tx.backgroundtask.update(where={"id": task_id}, data=record)
+
+    async def delete(self, task_id: str) -> None:
+        async with get_database_transaction() as tx:
+            await tx.backgroundtask.delete(where={"id": task_id})
+
+    async def get(self, task_id: str) -> Optional[Task]:
+        async with get_database_connection() as db:
+            record = await db.backgroundtask.find_unique(where={"id": task_id})
+        return Task.from_record(record) if record else None
+
+    async def load_pending(self) -> List[Task]:
+        statuses = [status.value for status in ACTIVE_STATUSES]
+        async with get_database_connection() as db:
+            records = await db.backgroundtask.find_many(
+                where={"status": {"in": statuses}},
+                order={"created_at": "asc"},
+            )
+        return [Task.from_record(record) for record in records]
+
+
+class TaskQueue:
+    """In-process scheduler with per-type priority queues and worker pools."""
+
+    def __init__(
+        self,
+        store: Optional[TaskStore] = None,
+        max_queued: Optional[int] = None,
+        shutdown_timeout: Optional[float] = None,
+    ) -> None:
+        self.store = store
+        self.max_queued = max_queued or settings.TASK_QUEUE_MAX_SIZE
+        self.shutdown_timeout = (
+            settings.TASK_SHUTDOWN_TIMEOUT_SECONDS if shutdown_timeout is None else shutdown_timeout
+        )
+        self._handlers: Dict[str, TaskHandler] = {}
+        self._concurrency: Dict[str, int] = {}
+        self._queues: Dict[str, asyncio.PriorityQueue] = {}
+        self._workers: Dict[str, List[asyncio.Task]] = {}
+        self._tasks: Dict[str, Task] = {}
+        self._active_keys: Dict[str, str] = {}
+        self._finished: "OrderedDict[str, None]" = OrderedDict()
+        self._running: Dict[str, asyncio.Task] = {}
+        self._sequence = itertools.count()
+        self._started = False
+        self._accepting = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._started
+
+    def register(self, task_type: str, handler: TaskHandler, concurrency: Optional[int] = None) -> None:
+        """Register the handler and worker count for a task type."""
+        self._handlers[task_type] = handler
+        self._concurrency[task_type] = concurrency or settings.TASK_DEFAULT_CONCURRENCY
+        self._queues.setdefault(task_type, asyncio.PriorityQueue(maxsize=self.max_queued))
+        if self._started:
+            self._spawn_workers(task_type)
+
+    async def start(self) -> None:
+        """Restore persisted work and start the worker pools."""
+        if self._started:
+            return
+        self._started = True
+        self._accepting = True
+        for task_type in self._handlers:
+            self._spawn_workers(task_type)
+        await self._restore()
+        logger.info(f"Task queue started with types: {', '.join(self._handlers) or 'none'}")
+
+    async def stop(self) -> None:
+        """
+        Stop accepting work and drain in-flight tasks.
+
+        Running tasks get ``shutdown_timeout`` seconds to finish. Tasks that
+        have not started stay queued in the store and resume on next start.
+        """
+        if not self._started:
+            return
+        self._accepting = False
+        workers = [worker for pool in self._workers.values() for worker in pool]
+        running = list(self._running.values())
+        for worker in workers:
+            if worker not in running:
+                worker.cancel()
+        if running:
+            logger.info(f"Draining {len(running)} running task(s)")
+            _, pending = await asyncio.wait(running, timeout=self.shutdown_timeout)
+            for worker in pending:
+                worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._workers.clear()
+        self._running.clear()
+        self._started = False
+        logger.info("Task queue stopped")
+
+    async def enqueue(
+        self,
+        task_type: str,
+        payload: Dict[str, Any],
+        key: Optional[str] = None,
+        priority: int = 0,
+        tenant_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Task:
+        """
+        Submit a task, collapsing onto an active task with the same key.
+
+        Higher ``priority`` values run first. When the queue for the type is
+        full the call waits up to ``timeout`` seconds for room (forever if
+        None, not at all if 0) and then raises :class:`QueueFullError`.
+
+        Returns:
+            Task: The new task, or the existing task with the same key
+        """
+        if task_type not in self._handlers:
+            raise ValueError(f"Unknown task type: {task_type}")
+        if not self._accepting:
+            raise QueueFullError("Task queue is not accepting work")
+
+        key = key or self._default_key(task_type, payload, tenant_id)
+        existing_id = self._active_keys.get(key)
+        if existing_id is not None:
+            return self._tasks[existing_id]
+
+        task = Task(type=task_type, key=key, payload=payload, priority=priority, tenant_id=tenant_id)
+        self._tasks[task.id] = task
+        self._active_keys[key] = task.id
+        # Persist before queueing: a worker may pick the task up as soon as
+        # it is put, and its status updates need the row to exist
+        await self._persist(task, created=True)
+        try:
+            await self._put(task, timeout)
+        except QueueFullError:
+            del self._tasks[task.id]
+            del self._active_keys[key]
+            await self._discard(task)
+            raise
+        return task
+
+    async def get(self, task_id: str) -> Optional[Task]:
+        """Return a task by id from memory, falling back to the store."""
+        task = self._tasks.get(task_id)
+        if task is None and self.store is not None:
+            try:
+                task = await self.store.get(task_id)
+            except Exception as e:
+                logger.error(f"Failed to load task {task_id}: {e}")
+        return task
+
+    def queued_count(self, task_type: str) -> int:
+        queue = self._queues.get(task_type)
+        return queue.qsize() if queue else 0
+
+    @staticmethod
+    def _default_key(task_type: str, payload: Dict[str, Any], tenant_id: Optional[str]) -> str:
+        # Tenants with identical payloads must not collapse onto each other's task
+        encoded = json.dumps(
+            {"type": task_type, "payload": payload, "tenant_id": tenant_id}, sort_keys=True
+        )
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    async def _put(self, task: Task, timeout: Optional[float]) -> None:
+        queue = self._queues[task.type]
+        item = (-task.priority, next(self._sequence), task.id)
+        try:
+            if timeout == 0:
+                queue.put_nowait(item)
+            else:
+                await asyncio.wait_for(queue.put(item), timeout)
+        except (asyncio.QueueFull, asyncio.TimeoutError):
+            raise QueueFullError(f"Queue for {task.type} is full ({self.max_queued} tasks)")
+
+    def _spawn_workers(self, task_type: str) -> None:
+        pool = self._workers.setdefault(task_type, [])
+        for index in range(len(pool), self._concurrency[task_type]):
+            pool.append(asyncio.create_task(self._worker(task_type), name=f"{task_type}-{index}"))
+
+    async def _worker(self, task_type: str) -> None:
+        queue = self._queues[task_type]
+        current = asyncio.current_task()
+        while self._accepting:
+            _, _, task_id = await queue.get()
+            self._running[task_id] = current
+            try:
+                await self._run(self._tasks[task_id])
+            finally:
+                self._running.pop(task_id, None)
+                queue.task_done()
+
+    async def _run(self, task: Task) -> None:
+        task.status = TaskStatus.RUNNING
+        task.attempts += 1
+        task.updated_at = int(time.time())
+        await self._persist(task)
+        try:
+            task.result = await self._handlers[task.type](task.payload)
+            task.status = TaskStatus.SUCCEEDED
+            task.error = None
+        except asyncio.CancelledError:
+            # Interrupted by shutdown; leave it queued so it runs again on restart
+            task.status = TaskStatus.QUEUED
+            task.updated_at = int(time.time())
+            await asyncio.shield(self._persist(task))
+            raise
+        except Exception as e:
+            logger.exception(f"Task {task.id} ({task.type}) failed")
+            task.status = TaskStatus.FAILED
+            task.error = str(e)
+        task.updated_at = int(time.time())
+        self._finish(task)
+        await self._persist(task)
+
+    def _finish(self, task: Task) -> None:
+        if self._active_keys.get(task.key) == task.id:
+            del self._active_keys[task.key]
+        self._finished[task.id] = None
+        while len(self._finished) > MAX_FINISHED_TASKS:
+            finished_id, _ = self._finished.popitem(last=False)
+            self._tasks.pop(finished_id, None)
+
+    async def _persist(self, task: Task, created: bool = False) -> None:
+        if self.store is None:
+            return
+        try:
+            if created:
+                await self.store.create(task)
+            else:
+                await self.store.update(task)
+        except Exception as e:
+            logger.error(f"Failed to persist task {task.id}: {e}")
+
+    async def _discard(self, task: Task) -> None:
+        if self.store is None:
+            return
+        try:
+            await self.store.delete(task.id)
+        except Exception as e:
+            logger.error(f"Failed to delete rejected task {task.id}: {e}")
+
+    async def _restore(self) -> None:
+        if self.store is None:
+            return
+        try:
+            pending = await self.store.load_pending()
+        except Exception as e:
+            logger.warning(f"Could not restore queued tasks: {e}")
+            return
+        restored = 0
+        for task in pending:
+            if task.type not in self._handlers or task.key in self._active_keys:
+                continue
+            task.status = TaskStatus.QUEUED
+            self._tasks[task.id] = task
+            self._active_keys[task.key] = task.id
+            try:
+                await self._put(task, timeout=0)
+            except QueueFullError:
+                del self._tasks[task.id]
+                del self._active_keys[task.key]
+                break
+            restored += 1
+        if restored:
+            logger.info(f"Restored {restored} queued task(s)")
+
+
+
+@lru_cache()
+def get_task_queue() -> TaskQueue:
+    """
+    Get a singleton instance of the task queue.
+
+    Returns:
+        TaskQueue: The application-wide task queue backed by Prisma
+    """
+    return TaskQueue(store=TaskStore())
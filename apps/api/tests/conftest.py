@@ -0,0 +1,182 @@
+import asyncio
+import json
+import os
+import socket
+import threading
+import time
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+os.environ.setdefault("JWT_SECRET", "test-secret")
+
+FAKE_TOKENS = ["Strong ", "Python ", "background, ", "good ", "fit."]
+
+
+class FakeLLMServer:
+    """OpenAI/Anthropic compatible streaming server running on localhost."""
+
+    TOKENS = FAKE_TOKENS
+
+    def __init__(self) -> None:
+        self.token_delay = 0.0
+        self.token_count = len(FAKE_TOKENS)
+        self.fail_with_status = 0
+        self.malformed_event = False
+        self.requests: list = []
+        self.cancelled = threading.Event()
+        self.base_url = ""
+        self._server = None
+        self._thread = None
+
+    def reset(self) -> None:
+        self.token_delay = 0.0
+        self.token_count = len(FAKE_TOKENS)
+        self.fail_with_status = 0
+        self.malformed_event = False
+        self.requests.clear()
+        self.cancelled.clear()
+
+    def _tokens(self):
+        return [FAKE_TOKENS[i % len(FAKE_TOKENS)] for i in range(self.token_count)]
+
+    async def _generate(self, render):
+        try:
+            for token in self._tokens():
+                if self.token_delay:
+                    await asyncio.sleep(self.token_delay)
+                yield render(token)
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+
+    async def openai(self, request: Request):
+        self.requests.append(await request.json())
+        if self.fail_with_status:
+            return JSONResponse({"error": "upstream failure"}, status_code=self.fail_with_status)
+
+        async def events():
+            async for chunk in self._generate(
+                lambda t: {"choices": [{"index": 0, "delta": {"content": t}}]}
+            ):
+                yield f"data: {json.dumps(chunk)}\n\n"
+                if self.malformed_event:
+                    yield 'data: {"choices": [\n\n'
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    async def anthropic(self, request: Request):
+        self.requests.append(await request.json())
+        if self.fail_with_status:
+            return JSONResponse({"error": "upstream failure"}, status_code=self.fail_with_status)
+
+        async def events():
+            yield 'event: message_start\ndata: {"type": "message_start"}\n\n'
+            async for chunk in self._generate(
+                lambda t: {"type": "content_block_delta", "delta": {"type": "text_delta", "text": t}}
+            ):
+                yield f"event: content_block_delta\ndata: {json.dumps(chunk)}\n\n"
+            yield 'event: message_stop\ndata: {"type": "message_stop"}\n\n'
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    def start(self) -> None:
+        app = Starlette(
+            routes=[
+                Route("/chat/completions", self.openai, methods=["POST"]),
+                Route("/messages", self.anthropic, methods=["POST"]),
+            ]
+        )
+        self.base_url, self._server, self._thread = serve(app)
+
+    def stop(self) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=5)
+
+
+def serve(app, lifespan: str = "off"):
+    """Run ``app`` under uvicorn on a free localhost port in a daemon thread."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    config = uvicorn.Config(app, log_level="warning", lifespan=lifespan)
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not server.started and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{sock.getsockname()[1]}", server, thread
+
+
+@pytest.fixture(scope="session")
+def _fake_llm_server():
+    server = FakeLLMServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def fake_llm(_fake_llm_server, monkeypatch):
+    from api.core.config import settings
+
+    _fake_llm_server.reset()
+    monkeypatch.setattr(settings, "OPENAI_BASE_URL", _fake_llm_server.base_url)
+    monkeypatch.setattr(settings, "ANTHROPIC_BASE_URL", _fake_llm_server.base_url)
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-openai-key")
+    monkeypatch.setattr(settings, "ANTHROPIC_API_KEY", "test-anthropic-key")
+    monkeypatch.setattr(settings, "LLM_CACHE_ENABLED", False)
+    return _fake_llm_server
+
+
+@pytest.fixture
+def api_client():
+    """
+    Return a factory for in-process clients authenticated as a tenant's user.
+
+    Example:
+        async with api_client("tenant-a") as client:
+            response = await client.get("/v1/candidates")
+
+    ``overrides`` adds further ``app.dependency_overrides``; all of them are
+    cleared when the client is closed.
+    """
+    from api.main import app
+    from api.services.auth import get_current_user
+
+    @asynccontextmanager
+    async def client(tenant_id: str = "tenant-a", overrides=None):
+        app.dependency_overrides[get_current_user] = lambda: {"tenant_id": tenant_id}
+        app.dependency_overrides.update(overrides or {})
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+                yield c
+        finally:
+            app.dependency_overrides.clear()
+
+    yield client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def live_api():
+    """Serve ``api.main:app`` over real HTTP as a ``tenant-a`` user and return its URL."""
+    from api.main import app
+    from api.services.auth import get_current_user
+
+    app.dependency_overrides[get_current_user] = lambda: {"tenant_id": "tenant-a"}
+    base_url, server, thread = serve(app, lifespan="on")
+    try:
+        yield base_url
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
+        app.dependency_overrides.clear()
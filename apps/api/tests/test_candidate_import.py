@@ -0,0 +1,207 @@
+import asyncio
+import io
+import json
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+from api.services import candidate_import
+from api.services.candidate_import import CandidateImporter, detect_format
+
+CSV_HEADER = "first_name,last_name,email,skills,career_level\n"
+
+
+class FakeCandidateTable:
+    def __init__(self, fail_on_batch: int = -1) -> None:
+        self.batches = []
+        self.fail_on_batch = fail_on_batch
+
+    async def create_many(self, data, skip_duplicates=False):
+        if len(self.batches) == self.fail_on_batch:
+            self.batches.append([])
+            raise RuntimeError("connection reset")
+        self.batches.append(data)
+        return len(data)
+
+
+def _transaction(table: FakeCandidateTable):
+    @asynccontextmanager
+    async def transaction():
+        yield SimpleNamespace(candidate=table)
+
+    return transaction
+
+
+def _csv(rows: int, bad_rows=()) -> bytes:
+    lines = [CSV_HEADER]
+    for n in range(rows):
+        email = "not-an-email" if n in bad_rows else f"candidate{n}@example.com"
+        lines.append(f"Jane,Doe {n},{email},python; sql,SENIOR\n")
+    return "".join(lines).encode("utf-8")
+
+
+def _run_import(data: bytes, fmt: str, table: FakeCandidateTable, batch_size: int):
+    async def scenario():
+        importer = CandidateImporter("tenant-a", batch_size=batch_size, transaction=_transaction(table))
+        return [progress async for progress in importer.run(io.BytesIO(data), fmt)]
+
+    return asyncio.run(scenario())
+
+
+def test_csv_import_writes_batches_and_reports_row_errors():
+    table = FakeCandidateTable()
+    updates = _run_import(_csv(25, bad_rows={3, 17}), "csv", table, batch_size=10)
+
+    assert [len(batch) for batch in table.batches] == [9, 9, 5]
+    assert table.batches[0][0]["tenant_id"] == "tenant-a"
+    assert table.batches[0][0]["skills"] == ["python", "sql"]
+    assert [p.processed for p in updates] == [10, 20, 25, 25]
+    assert [e.row for p in updates for e in p.errors] == [5, 19]
+    assert "email" in updates[0].errors[0].errors[0]
+    final = updates[-1]
+    assert final.done is True
+    assert (final.imported, final.failed) == (23, 2)
+
+
+def test_jsonl_import_reports_malformed_lines():
+    lines = [
+        json.dumps({"first_name": "Ada", "last_name": "Lovelace", "email": "ada@example.com"}),
+        "{not json",
+        "",
+        json.dumps(["not", "an", "object"]),
+        json.dumps({"first_name": "Alan", "last_name": "Turing", "email": "alan@example.com"}),
+    ]
+    table = FakeCandidateTable()
+    updates = _run_import("\n".join(lines).encode("utf-8"), "jsonl", table, batch_size=100)
+
+    assert [c["email"] for c in table.batches[0]] == ["ada@example.com", "alan@example.com"]
+    assert [e.row for e in updates[0].errors] == [2, 4]
+    assert (updates[-1].imported, updates[-1].failed) == (2, 2)
+
+
+def test_undecodable_and_oversized_rows_are_reported_per_row():
+    rows = _csv(6).splitlines(keepends=True)
+    # A Latin-1 export byte, a field past the csv field size limit and a
+    # quoted multi-line field that must still count as one row
+    rows[2] = b"Ren\xe9,Doe 1,candidate1@example.com,python,SENIOR\n"
+    rows[4] = b"Jane,Doe 3," + b"x" * 200_000 + b"@example.com,python,SENIOR\n"
+    rows[5] = b'Jane,"Doe\n4",candidate4@example.com,python,SENIOR\n'
+    table = FakeCandidateTable()
+    updates = _run_import(b"\xef\xbb\xbf" + b"".join(rows), "csv", table, batch_size=3)
+
+    assert [e.row for p in updates for e in p.errors] == [3, 5]
+    assert "UTF-8" in updates[0].errors[0].errors[0]
+    assert "field larger than field limit" in updates[1].errors[0].errors[0]
+    assert [c["email"] for batch in table.batches for c in batch] == [
+        "candidate0@example.com",
+        "candidate2@example.com",
+        "candidate4@example.com",
+        "candidate5@example.com",
+    ]
+    assert (updates[-1].processed, updates[-1].imported, updates[-1].failed) == (6, 4, 2)
+
+
+def test_csv_rows_with_the_wrong_field_count_are_reported():
+    rows = _csv(4).splitlines(keepends=True)
+    # An unquoted comma in a name shifts every later column
+    rows[2] = b"Jane,Doe, Jr.,candidate1@example.com,python,SENIOR\n"
+    rows[3] = b"Jane,Doe 2,candidate2@example.com\n"
+    table = FakeCandidateTable()
+    updates = _run_import(b"".join(rows), "csv", table, batch_size=100)
+
+    assert [e.row for e in updates[0].errors] == [3, 4]
+    assert updates[0].errors[0].errors == ["Row has 6 fields, expected 5 from the header"]
+    assert [c["email"] for c in table.batches[0]] == [
+        "candidate0@example.com",
+        "candidate3@example.com",
+    ]
+
+
+def test_jsonl_import_reports_undecodable_lines():
+    lines = [
+        json.dumps({"first_name": "Ada", "last_name": "Lovelace", "email": "ada@example.com"}).encode(),
+        b'{"first_name": "Ren\xe9", "last_name": "Doe", "email": "rene@example.com"}',
+        json.dumps({"first_name": "Alan", "last_name": "Turing", "email": "alan@example.com"}).encode(),
+    ]
+    table = FakeCandidateTable()
+    updates = _run_import(b"\n".join(lines), "jsonl", table, batch_size=100)
+
+    assert [c["email"] for c in table.batches[0]] == ["ada@example.com", "alan@example.com"]
+    assert [e.row for e in updates[0].errors] == [2]
+
+
+def test_closing_the_import_waits_for_the_reader_thread():
+    class SlowFile(io.BytesIO):
+        reading = False
+        lines_read = 0
+
+        def __next__(self):
+            self.reading = True
+            try:
+                time.sleep(0.002)
+                self.lines_read += 1
+                return super().__next__()
+            finally:
+                self.reading = False
+
+    upload = SlowFile(_csv(500))
+
+    async def scenario():
+        importer = CandidateImporter("tenant-a", batch_size=50, transaction=_transaction(FakeCandidateTable()))
+        updates = importer.run(upload, "csv")
+        await updates.__anext__()
+        # Let the next batch's reader thread get going, as a client
+        # disconnecting mid-import would
+        await asyncio.sleep(0.01)
+        await updates.aclose()
+        # Still no reads once the importer has closed
+        reading, lines_read = upload.reading, upload.lines_read
+        await asyncio.sleep(0.05)
+        return reading, lines_read
+
+    reading, lines_read = asyncio.run(scenario())
+
+    assert reading is False
+    assert upload.lines_read == lines_read < 200
+
+
+def test_failed_batch_does_not_abort_import():
+    table = FakeCandidateTable(fail_on_batch=1)
+    updates = _run_import(_csv(30), "csv", table, batch_size=10)
+
+    final = updates[-1]
+    assert (final.processed, final.imported, final.failed) == (30, 20, 10)
+    assert updates[1].errors[0].errors == ["Database error: connection reset"]
+
+
+def test_detect_format():
+    assert detect_format("candidates.CSV") == "csv"
+    assert detect_format("candidates.ndjson") == "jsonl"
+    assert detect_format("upload", "application/x-ndjson") == "jsonl"
+    assert detect_format("candidates.xlsx") is None
+
+
+def test_import_route_streams_progress(monkeypatch, api_client):
+    table = FakeCandidateTable()
+    monkeypatch.setattr(candidate_import, "get_database_transaction", _transaction(table))
+
+    async def scenario():
+        async with api_client("tenant-a") as client:
+            ok = await client.post(
+                "/v1/candidates/import?batch_size=5",
+                files={"file": ("candidates.csv", _csv(12), "text/csv")},
+            )
+            unsupported = await client.post(
+                "/v1/candidates/import",
+                files={"file": ("candidates.xlsx", b"", "application/octet-stream")},
+            )
+        return ok, unsupported
+
+    ok, unsupported = asyncio.run(scenario())
+
+    assert ok.status_code == 200
+    updates = [json.loads(line) for line in ok.text.splitlines()]
+    assert [u["processed"] for u in updates] == [5, 10, 12, 12]
+    assert updates[-1]["done"] is True
+    assert updates[-1]["imported"] == 12
+    assert unsupported.status_code == 415
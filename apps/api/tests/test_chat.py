@@ -0,0 +1,141 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from api.schemas.chat import ChatMessage
+from api.services.llm import LLMError, LLMService, close_http_client
+
+MESSAGES = [
+    ChatMessage(role="system", content="You are a recruiting assistant."),
+    ChatMessage(role="user", content="Summarize this resume."),
+]
+
+
+def _run(coro):
+    async def _with_cleanup():
+        try:
+            return await coro
+        finally:
+            await close_http_client()
+
+    return asyncio.run(_with_cleanup())
+
+
+async def _collect(model: str) -> list:
+    return [token async for token in LLMService().stream(MESSAGES, model=model)]
+
+
+def _parse_events(body: str) -> list:
+    return [
+        line[len("data: "):]
+        for line in body.splitlines()
+        if line.startswith("data: ")
+    ]
+
+
+def test_stream_openai_tokens_in_order(fake_llm):
+    tokens = _run(_collect("gpt-4o"))
+
+    assert tokens == fake_llm.TOKENS
+    request = fake_llm.requests[0]
+    assert request["stream"] is True
+    assert request["messages"][0]["role"] == "system"
+
+
+def test_stream_anthropic_tokens_and_system_prompt(fake_llm):
+    tokens = _run(_collect("claude-3-5-sonnet-latest"))
+
+    assert tokens == fake_llm.TOKENS
+    request = fake_llm.requests[0]
+    assert request["system"] == "You are a recruiting assistant."
+    assert [m["role"] for m in request["messages"]] == ["user"]
+
+
+def test_stream_raises_on_upstream_error(fake_llm):
+    fake_llm.fail_with_status = 500
+
+    with pytest.raises(LLMError):
+        _run(_collect("gpt-4o"))
+
+
+def test_stream_raises_on_malformed_event(fake_llm):
+    fake_llm.malformed_event = True
+
+    with pytest.raises(LLMError):
+        _run(_collect("gpt-4o"))
+
+
+def test_closing_stream_cancels_upstream_generation(fake_llm):
+    fake_llm.token_count = 200
+    fake_llm.token_delay = 0.02
+
+    async def _read_first_token():
+        tokens = LLMService().stream(MESSAGES)
+        first = await tokens.__anext__()
+        await tokens.aclose()
+        return first
+
+    assert _run(_read_first_token()) == fake_llm.TOKENS[0]
+    assert fake_llm.cancelled.wait(timeout=2)
+
+
+def test_client_disconnect_cancels_upstream_generation(fake_llm, live_api):
+    fake_llm.token_count = 200
+    fake_llm.token_delay = 0.02
+    payload = {"messages": [{"role": "user", "content": "Hi"}]}
+
+    # Leaving the block after the first event drops the connection mid-stream
+    with httpx.stream("POST", f"{live_api}/v1/chat/completions", json=payload) as response:
+        first = next(line for line in response.iter_lines() if line.startswith("data: "))
+
+    assert fake_llm.cancelled.wait(timeout=2)
+    assert json.loads(first[len("data: "):])["content"] == fake_llm.TOKENS[0]
+
+
+@pytest.fixture
+def post_completion(api_client):
+    async def post(payload: dict) -> httpx.Response:
+        async with api_client("tenant-1") as client:
+            return await client.post("/v1/chat/completions", json=payload)
+
+    return post
+
+
+def test_chat_completions_endpoint_streams_sse(fake_llm, post_completion):
+    payload = {"messages": [{"role": "user", "content": "Hi"}]}
+    response = _run(post_completion(payload))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _parse_events(response.text)
+    assert events[-1] == "[DONE]"
+    assert "".join(json.loads(e)["content"] for e in events[:-1]) == "".join(fake_llm.TOKENS)
+
+
+def test_chat_completions_endpoint_reports_stream_errors(fake_llm, post_completion):
+    fake_llm.fail_with_status = 401
+    payload = {"messages": [{"role": "user", "content": "Hi"}]}
+    response = _run(post_completion(payload))
+
+    assert "event: error" in response.text
+
+
+def test_chat_completions_endpoint_reports_malformed_events(fake_llm, post_completion):
+    fake_llm.malformed_event = True
+    payload = {"messages": [{"role": "user", "content": "Hi"}]}
+    response = _run(post_completion(payload))
+
+    assert response.status_code == 200
+    assert json.loads(_parse_events(response.text)[0])["content"] == fake_llm.TOKENS[0]
+    assert "event: error" in response.text
+
+
+def test_chat_completions_endpoint_without_streaming(fake_llm, post_completion):
+    payload = {"messages": [{"role": "user", "content": "Hi"}], "stream": False}
+    response = _run(post_completion(payload))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["message"] == {"role": "assistant", "content": "".join(fake_llm.TOKENS)}
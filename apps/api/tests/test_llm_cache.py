@@ -0,0 +1,224 @@
+import asyncio
+import sqlite3
+
+from api.schemas.chat import ChatMessage
+from api.services import llm_cache
+from api.services.llm import LLMService, close_http_client
+from api.services.llm_cache import (
+    EmbeddingIndex,
+    LLMCache,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+)
+
+MESSAGES = [ChatMessage(role="user", content="Summarize the resume of Jane Doe")]
+PARAMS = {"temperature": 0.0, "max_tokens": 256}
+
+
+async def _bag_of_words(text: str) -> list:
+    vocabulary = ["summarize", "resume", "jane", "doe", "screen", "job", "python"]
+    words = text.lower().replace(":", " ").split()
+    return [float(words.count(term)) for term in vocabulary]
+
+
+def test_exact_hit_and_stats():
+    cache = LLMCache()
+
+    assert asyncio.run(cache.get("tenant-a", "gpt-4o", MESSAGES, PARAMS)) is None
+    asyncio.run(cache.set("tenant-a", "gpt-4o", MESSAGES, PARAMS, "Summary", latency=1.5))
+
+    assert asyncio.run(cache.get("tenant-a", "gpt-4o", MESSAGES, PARAMS)) == "Summary"
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_rate == 0.5
+    assert cache.stats.latency_saved_seconds == 1.5
+
+
+def test_stats_endpoint_only_reports_the_callers_tenant(monkeypatch, api_client):
+    cache = LLMCache()
+    monkeypatch.setattr("api.routes.v1.chat.get_llm_cache", lambda: cache)
+    asyncio.run(cache.set("tenant-a", "gpt-4o", MESSAGES, PARAMS, "Summary", latency=2.0))
+    asyncio.run(cache.get("tenant-a", "gpt-4o", MESSAGES, PARAMS))
+    asyncio.run(cache.get("tenant-b", "gpt-4o", MESSAGES, PARAMS))
+
+    async def stats_as(tenant_id: str) -> dict:
+        async with api_client(tenant_id) as client:
+            return (await client.get("/v1/chat/cache/stats")).json()
+
+    tenant_a, tenant_b = asyncio.run(stats_as("tenant-a")), asyncio.run(stats_as("tenant-b"))
+
+    assert (tenant_a["hits"], tenant_a["misses"], tenant_a["latency_saved_seconds"]) == (1, 0, 2.0)
+    assert (tenant_b["hits"], tenant_b["misses"], tenant_b["latency_saved_seconds"]) == (0, 1, 0.0)
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_key_covers_tenant_model_and_params():
+    cache = LLMCache()
+    asyncio.run(cache.set("tenant-a", "gpt-4o", MESSAGES, PARAMS, "Summary"))
+
+    assert asyncio.run(cache.get("tenant-b", "gpt-4o", MESSAGES, PARAMS)) is None
+    assert asyncio.run(cache.get("tenant-a", "gpt-4o-mini", MESSAGES, PARAMS)) is None
+    assert asyncio.run(cache.get("tenant-a", "gpt-4o", MESSAGES, {**PARAMS, "max_tokens": 1})) is None
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now[0])
+    cache = LLMCache(ttl_seconds=60)
+    asyncio.run(cache.set("tenant-a", "gpt-4o", MESSAGES, PARAMS, "Summary"))
+
+    now[0] += 61
+
+    assert asyncio.run(cache.get("tenant-a", "gpt-4o", MESSAGES, PARAMS)) is None
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryCacheBackend(max_entries=2)
+    cache = LLMCache(backend=backend)
+    first, second, third = (
+        [ChatMessage(role="user", content=f"prompt {i}")] for i in range(3)
+    )
+    asyncio.run(cache.set("t", "gpt-4o", first, PARAMS, "1"))
+    asyncio.run(cache.set("t", "gpt-4o", second, PARAMS, "2"))
+    asyncio.run(cache.get("t", "gpt-4o", first, PARAMS))
+    asyncio.run(cache.set("t", "gpt-4o", third, PARAMS, "3"))
+
+    assert asyncio.run(cache.get("t", "gpt-4o", first, PARAMS)) == "1"
+    assert asyncio.run(cache.get("t", "gpt-4o", second, PARAMS)) is None
+
+
+def test_sqlite_backend_survives_restart_and_evicts(tmp_path):
+    path = str(tmp_path / "llm-cache.sqlite3")
+    backend = SQLiteCacheBackend(path, max_entries=2)
+    cache = LLMCache(backend=backend)
+    for i in range(3):
+        messages = [ChatMessage(role="user", content=f"prompt {i}")]
+        asyncio.run(cache.set("t", "gpt-4o", messages, PARAMS, str(i)))
+    backend.close()
+
+    reopened = LLMCache(backend=SQLiteCacheBackend(path, max_entries=2))
+    lookups = [
+        asyncio.run(reopened.get("t", "gpt-4o", [ChatMessage(role="user", content=f"prompt {i}")], PARAMS))
+        for i in range(3)
+    ]
+
+    assert lookups == [None, "1", "2"]
+
+
+def test_sqlite_backend_batches_access_times_into_next_write(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path / "llm-cache.sqlite3"), max_entries=2)
+    cache = LLMCache(backend=backend)
+    first, second, third = (
+        [ChatMessage(role="user", content=f"prompt {i}")] for i in range(3)
+    )
+    asyncio.run(cache.set("t", "gpt-4o", first, PARAMS, "1"))
+    asyncio.run(cache.set("t", "gpt-4o", second, PARAMS, "2"))
+
+    assert asyncio.run(cache.get("t", "gpt-4o", first, PARAMS)) == "1"
+    assert not backend._conn.in_transaction
+    asyncio.run(cache.set("t", "gpt-4o", third, PARAMS, "3"))
+
+    assert asyncio.run(cache.get("t", "gpt-4o", first, PARAMS)) == "1"
+    assert asyncio.run(cache.get("t", "gpt-4o", second, PARAMS)) is None
+    backend.close()
+
+
+def test_sqlite_backends_sharing_a_file_share_the_eviction_limit(tmp_path):
+    path = str(tmp_path / "llm-cache.sqlite3")
+    workers = [LLMCache(backend=SQLiteCacheBackend(path, max_entries=3)) for _ in range(2)]
+    for i in range(8):
+        messages = [ChatMessage(role="user", content=f"prompt {i}")]
+        asyncio.run(workers[i % 2].set("t", "gpt-4o", messages, PARAMS, str(i)))
+
+    (rows,) = workers[0].backend._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+    assert rows == 3
+    assert workers[1].backend._size() == 3
+    for worker in workers:
+        worker.backend.close()
+
+
+def test_close_llm_cache_flushes_queued_access_times(tmp_path, monkeypatch):
+    path = str(tmp_path / "llm-cache.sqlite3")
+    monkeypatch.setattr(llm_cache.settings, "LLM_CACHE_PATH", path)
+    llm_cache.get_llm_cache.cache_clear()
+    cache = llm_cache.get_llm_cache()
+    asyncio.run(cache.set("t", "gpt-4o", MESSAGES, PARAMS, "Summary"))
+    (stored,) = cache.backend._conn.execute("SELECT accessed_at FROM llm_cache").fetchone()
+    asyncio.run(cache.get("t", "gpt-4o", MESSAGES, PARAMS))
+
+    asyncio.run(llm_cache.close_llm_cache())
+
+    reopened = SQLiteCacheBackend(path, max_entries=2)
+    (accessed_at,) = reopened._conn.execute("SELECT accessed_at FROM llm_cache").fetchone()
+    reopened.close()
+    assert accessed_at > stored
+    assert llm_cache.get_llm_cache.cache_info().currsize == 0
+
+
+class FailingBackend(MemoryCacheBackend):
+    def get(self, key):
+        raise sqlite3.OperationalError("database is locked")
+
+    def set(self, key, entry):
+        raise sqlite3.OperationalError("database or disk is full")
+
+
+def test_backend_errors_are_treated_as_a_miss(fake_llm):
+    service = LLMService(cache=LLMCache(backend=FailingBackend(max_entries=2)))
+
+    async def stream():
+        try:
+            return [token async for token in service.stream(MESSAGES, temperature=0.0)]
+        finally:
+            await close_http_client()
+
+    assert "".join(asyncio.run(stream())) == "".join(fake_llm.TOKENS)
+    assert len(fake_llm.requests) == 1
+    assert service.cache.stats.misses == 1
+
+
+def test_semantic_tier_matches_similar_prompts_within_tenant():
+    cache = LLMCache(embed=_bag_of_words, similarity_threshold=0.9)
+    asyncio.run(cache.set("tenant-a", "gpt-4o", MESSAGES, PARAMS, "Summary"))
+    similar = [ChatMessage(role="user", content="Please summarize the resume of Jane Doe")]
+    unrelated = [ChatMessage(role="user", content="Screen python job")]
+
+    assert asyncio.run(cache.get("tenant-a", "gpt-4o", similar, PARAMS)) == "Summary"
+    assert asyncio.run(cache.get("tenant-b", "gpt-4o", similar, PARAMS)) is None
+    assert asyncio.run(cache.get("tenant-a", "gpt-4o", unrelated, PARAMS)) is None
+    assert cache.stats.semantic_hits == 1
+
+
+def test_embedding_index_caps_each_scope_and_the_total():
+    index = EmbeddingIndex(max_entries=3, max_entries_per_scope=2)
+    for key, vector in [("a1", [1, 0]), ("a2", [0, 1]), ("a3", [1, 1])]:
+        index.add("tenant-a", key, vector)
+    index.add("tenant-b", "b1", [1, 0])
+
+    assert index.search("tenant-a", [1, 0.1])[0] == "a3"
+    assert index.search("tenant-a", [0, 1])[0] == "a2"
+    assert index.search("tenant-b", [0, 1]) == ("b1", 0.0)
+
+    index.add("tenant-b", "b2", [0, 1])
+    assert index.search("tenant-a", [0, 1])[0] == "a3"
+    assert index.search("tenant-c", [0, 1]) == (None, -1.0)
+
+
+def test_llm_service_serves_repeat_prompts_from_cache(fake_llm):
+    service = LLMService(cache=LLMCache())
+
+    async def _complete_twice(temperature: float):
+        try:
+            first = await service.complete(MESSAGES, temperature=temperature, tenant_id="t")
+            second = await service.complete(MESSAGES, temperature=temperature, tenant_id="t")
+            return first, second
+        finally:
+            await close_http_client()
+
+    first, second = asyncio.run(_complete_twice(0.0))
+    assert first == second == "".join(fake_llm.TOKENS)
+    assert len(fake_llm.requests) == 1
+    assert service.cache.stats.hits == 1
+
+    asyncio.run(_complete_twice(0.7))
+    assert len(fake_llm.requests) == 3
@@ -0,0 +1,203 @@
+import asyncio
+import base64
+import json
+import operator
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from api.db import pagination
+from api.db.pagination import (
+    InvalidCursorError,
+    InvalidFieldsError,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+    parse_fields,
+)
+from api.routes.v1 import candidates
+
+OPERATORS = {"lt": operator.lt, "lte": operator.le, "gt": operator.gt, "gte": operator.ge}
+
+
+def _matches(row: dict, where) -> bool:
+    if not where:
+        return True
+    for key, condition in where.items():
+        if key == "AND":
+            if not all(_matches(row, c) for c in condition):
+                return False
+        elif key == "OR":
+            if not any(_matches(row, c) for c in condition):
+                return False
+        elif isinstance(condition, dict):
+            if not all(OPERATORS[op](row[key], v) for op, v in condition.items()):
+                return False
+        elif row[key] != condition:
+            return False
+    return True
+
+
+class FakeModel:
+    """Evaluates the Prisma query shapes used by ``paginate`` over a list."""
+
+    def __init__(self, rows) -> None:
+        self.rows = rows
+        self.queries = []
+
+    async def find_many(self, where=None, order=None, take=None):
+        self.queries.append({"where": where, "order": order, "take": take})
+        rows = [row for row in self.rows if _matches(row, where)]
+        for clause in reversed(order or []):
+            (field, direction), = clause.items()
+            rows.sort(key=lambda row: row[field], reverse=direction == "desc")
+        return rows[:take]
+
+
+def _rows(count: int, tenant: str = "tenant-a"):
+    # Duplicate timestamps exercise the id tie-breaker
+    return [
+        {"id": f"{tenant}-{n:04d}", "tenant_id": tenant, "created_at": n // 3, "email": f"{n}@x.io"}
+        for n in range(count)
+    ]
+
+
+def _walk(model, **kwargs):
+    async def scenario():
+        pages, cursor = [], None
+        while True:
+            page = await paginate(model, cursor=cursor, **kwargs)
+            pages.append(page)
+            cursor = page.next_cursor
+            if cursor is None:
+                return pages
+
+    return asyncio.run(scenario())
+
+
+def test_cursor_round_trip_is_opaque_and_url_safe():
+    cursor = encode_cursor(1718000000, "cand_1")
+
+    assert decode_cursor(cursor) == (1718000000, "cand_1")
+    assert all(c.isalnum() or c in "-_" for c in cursor)
+
+
+def test_invalid_cursor_raises():
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor!")
+
+
+def _raw_cursor(payload) -> str:
+    raw = json.dumps(payload).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+@pytest.mark.parametrize(
+    "value, record_id",
+    [
+        ({"dt": "garbage"}, "cand_1"),
+        ({"dt": 5}, "cand_1"),
+        ({"gt": 1}, "cand_1"),
+        ([1, 2], "cand_1"),
+        (None, "cand_1"),
+        (True, "cand_1"),
+        (1718000000, {"not": "an id"}),
+        (1718000000, 7),
+    ],
+)
+def test_tampered_cursor_raises(value, record_id):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(_raw_cursor(["created_at", "desc", value, record_id]))
+
+
+def test_datetime_cursor_round_trip():
+    created = datetime(2024, 6, 10, 12, 30, tzinfo=timezone.utc)
+
+    assert decode_cursor(encode_cursor(created, "cand_1")) == (created, "cand_1")
+
+
+def test_cursor_is_bound_to_its_sort_field_and_direction():
+    cursor = encode_cursor(1718000000, "cand_1", "created_at", descending=True)
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, "updated_at", descending=True)
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, "created_at", descending=False)
+
+
+def test_pages_cover_every_row_exactly_once_in_order():
+    model = FakeModel(_rows(23) + _rows(5, tenant="tenant-b"))
+    pages = _walk(model, where={"tenant_id": "tenant-a"}, limit=5)
+
+    ids = [item["id"] for page in pages for item in page.items]
+    expected = sorted((r for r in _rows(23)), key=lambda r: (r["created_at"], r["id"]), reverse=True)
+    assert ids == [r["id"] for r in expected]
+    assert [len(page.items) for page in pages] == [5, 5, 5, 5, 3]
+    assert pages[-1].has_more is False
+    assert all(query["take"] == 6 for query in model.queries)
+
+
+def test_ascending_order_and_projection():
+    model = FakeModel(_rows(7))
+    pages = _walk(model, descending=False, limit=3, fields=parse_fields("email", ["email", "id"]))
+
+    items = [item for page in pages for item in page.items]
+    assert [item["id"] for item in items] == [r["id"] for r in _rows(7)]
+    assert set(items[0]) == {"id", "email"}
+
+
+def test_parse_fields_rejects_unknown_fields():
+    assert parse_fields(None, ["email"]) is None
+    with pytest.raises(InvalidFieldsError):
+        parse_fields("email,password_hash", ["email"])
+
+
+def test_list_candidates_route(monkeypatch, api_client):
+    # Internal columns must not leak when no projection is requested
+    model = FakeModel([{**row, "internal_notes": "do not hire"} for row in _rows(4)])
+
+    @asynccontextmanager
+    async def connection():
+        yield SimpleNamespace(candidate=model)
+
+    monkeypatch.setattr(candidates, "get_database_connection", connection)
+
+    async def scenario():
+        async with api_client("tenant-a") as client:
+            first = await client.get("/v1/candidates", params={"limit": 3, "fields": "email"})
+            cursor = first.json()["next_cursor"]
+            second = await client.get("/v1/candidates", params={"limit": 3, "cursor": cursor})
+            bad_cursor = await client.get("/v1/candidates", params={"cursor": "%%%"})
+            tampered = await client.get(
+                "/v1/candidates",
+                params={"cursor": _raw_cursor(["created_at", "desc", {"dt": 5}, "x"])},
+            )
+            other_sort = await client.get(
+                "/v1/candidates", params={"cursor": cursor, "sort": "updated_at"}
+            )
+            bad_fields = await client.get("/v1/candidates", params={"fields": "secret"})
+        return first, second, bad_cursor, tampered, other_sort, bad_fields
+
+    first, second, bad_cursor, tampered, other_sort, bad_fields = asyncio.run(scenario())
+
+    assert first.status_code == 200
+    assert first.json()["has_more"] is True
+    assert [set(item) for item in first.json()["items"]] == [{"id", "email"}] * 3
+    assert [item["id"] for item in second.json()["items"]] == ["tenant-a-0000"]
+    assert set(second.json()["items"][0]) == {"id", "tenant_id", "created_at", "email"}
+    assert second.json()["has_more"] is False
+    assert bad_cursor.status_code == 400
+    assert tampered.status_code == 400
+    assert other_sort.status_code == 400
+    assert len(model.queries) == 2
+    assert bad_fields.status_code == 400
+
+
+def test_page_size_is_capped():
+    model = FakeModel(_rows(3))
+    asyncio.run(paginate(model, limit=10_000))
+
+    assert model.queries[0]["take"] == pagination.MAX_PAGE_SIZE + 1
+    assert model.queries[0]["where"] is None
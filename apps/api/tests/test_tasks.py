@@ -0,0 +1,295 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from api.schemas.task import TaskStatus
+from api.services.tasks import QueueFullError, Task, TaskQueue, TaskStore, get_task_queue
+
+
+class MemoryTaskStore(TaskStore):
+    def __init__(self) -> None:
+        self.tasks = {}
+
+    async def create(self, task):
+        self.tasks[task.id] = task.to_record()
+
+    async def update(self, task):
+        self.tasks[task.id] = task.to_record()
+
+    async def delete(self, task_id):
+        self.tasks.pop(task_id, None)
+
+    async def get(self, task_id):
+        return None
+
+    async def load_pending(self):
+        return [
+            Task.from_record(SimpleNamespace(**record))
+            for record in self.tasks.values()
+            if record["status"] in ("QUEUED", "RUNNING")
+        ]
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.005)
+
+
+def test_higher_priority_tasks_run_first():
+    async def scenario():
+        order = []
+        gate = asyncio.Event()
+
+        async def handler(payload):
+            if payload["name"] == "blocker":
+                await gate.wait()
+            order.append(payload["name"])
+
+        queue = TaskQueue()
+        queue.register("score", handler, concurrency=1)
+        await queue.start()
+        await queue.enqueue("score", {"name": "blocker"})
+        await _wait_for(lambda: queue.queued_count("score") == 0)
+        low = await queue.enqueue("score", {"name": "low"}, priority=0)
+        high = await queue.enqueue("score", {"name": "high"}, priority=10)
+        gate.set()
+        await _wait_for(lambda: low.status == TaskStatus.SUCCEEDED)
+        await queue.stop()
+        return order, high
+
+    order, high = asyncio.run(scenario())
+
+    assert order == ["blocker", "high", "low"]
+    assert high.status == TaskStatus.SUCCEEDED
+
+
+def test_worker_concurrency_is_bounded_per_type():
+    async def scenario():
+        running, peak = 0, 0
+
+        async def handler(payload):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        queue = TaskQueue()
+        queue.register("embed", handler, concurrency=2)
+        await queue.start()
+        tasks = [await queue.enqueue("embed", {"n": n}) for n in range(8)]
+        await _wait_for(lambda: all(t.status == TaskStatus.SUCCEEDED for t in tasks))
+        await queue.stop()
+        return peak
+
+    assert asyncio.run(scenario()) == 2
+
+
+def test_duplicate_submissions_collapse_onto_active_task():
+    async def scenario():
+        calls = []
+        gate = asyncio.Event()
+
+        async def handler(payload):
+            calls.append(payload)
+            await gate.wait()
+            return {"chunks": 3}
+
+        queue = TaskQueue()
+        queue.register("parse", handler)
+        await queue.start()
+        first = await queue.enqueue("parse", {"document_id": "doc-1"})
+        second = await queue.enqueue("parse", {"document_id": "doc-1"})
+        keyed = await queue.enqueue("parse", {"document_id": "other"}, key=first.key)
+        gate.set()
+        await _wait_for(lambda: first.status == TaskStatus.SUCCEEDED)
+        await queue.stop()
+        return calls, first, second, keyed
+
+    calls, first, second, keyed = asyncio.run(scenario())
+
+    assert first.id == second.id == keyed.id
+    assert len(calls) == 1
+    assert first.result == {"chunks": 3}
+
+
+def test_enqueue_applies_backpressure_when_full():
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def handler(payload):
+            await gate.wait()
+
+        store = MemoryTaskStore()
+        queue = TaskQueue(store=store, max_queued=1)
+        queue.register("crawl", handler, concurrency=1)
+        await queue.start()
+        await queue.enqueue("crawl", {"url": "a"})
+        await _wait_for(lambda: queue.queued_count("crawl") == 0)
+        await queue.enqueue("crawl", {"url": "b"})
+        try:
+            with pytest.raises(QueueFullError):
+                await queue.enqueue("crawl", {"url": "c"}, timeout=0)
+            with pytest.raises(QueueFullError):
+                await queue.enqueue("crawl", {"url": "c"}, timeout=0.01)
+            # Rejected submissions leave no row behind to be restored later
+            assert len(store.tasks) == 2
+        finally:
+            gate.set()
+            await queue.stop()
+
+    asyncio.run(scenario())
+
+
+def test_task_row_exists_before_a_worker_updates_it():
+    class SlowCreateStore(MemoryTaskStore):
+        def __init__(self) -> None:
+            super().__init__()
+            self.log = []
+
+        async def create(self, task):
+            await asyncio.sleep(0.01)
+            self.log.append(("create", task.status.value))
+            await super().create(task)
+
+        async def update(self, task):
+            self.log.append(("update" if task.id in self.tasks else "update-missing", task.status.value))
+            await super().update(task)
+
+    async def scenario():
+        async def handler(payload):
+            return {"ok": True}
+
+        store = SlowCreateStore()
+        queue = TaskQueue(store=store)
+        queue.register("score", handler, concurrency=1)
+        await queue.start()
+        task = await queue.enqueue("score", {"candidate": "c1"})
+        await _wait_for(lambda: store.tasks[task.id]["status"] == "SUCCEEDED")
+        await queue.stop()
+        return store
+
+    store = asyncio.run(scenario())
+
+    assert store.log == [("create", "QUEUED"), ("update", "RUNNING"), ("update", "SUCCEEDED")]
+    assert asyncio.run(store.load_pending()) == []
+
+
+def test_failed_tasks_record_error():
+    async def scenario():
+        async def handler(payload):
+            raise ValueError("unparseable resume")
+
+        queue = TaskQueue()
+        queue.register("parse", handler)
+        await queue.start()
+        task = await queue.enqueue("parse", {"document_id": "doc-1"})
+        await _wait_for(lambda: task.status == TaskStatus.FAILED)
+        await queue.stop()
+        return task
+
+    task = asyncio.run(scenario())
+
+    assert task.error == "unparseable resume"
+    assert task.attempts == 1
+
+
+def test_stop_drains_running_tasks_and_keeps_queued_ones():
+    store = MemoryTaskStore()
+
+    async def scenario():
+        started = asyncio.Event()
+
+        async def handler(payload):
+            started.set()
+            await asyncio.sleep(0.05)
+
+        queue = TaskQueue(store=store, shutdown_timeout=2)
+        queue.register("embed", handler, concurrency=1)
+        await queue.start()
+        running = await queue.enqueue("embed", {"n": 1})
+        waiting = await queue.enqueue("embed", {"n": 2})
+        await started.wait()
+        await queue.stop()
+        with pytest.raises(QueueFullError):
+            await queue.enqueue("embed", {"n": 3})
+        return running, waiting
+
+    running, waiting = asyncio.run(scenario())
+
+    assert running.status == TaskStatus.SUCCEEDED
+    assert waiting.status == TaskStatus.QUEUED
+    assert store.tasks[running.id]["status"] == "SUCCEEDED"
+    assert store.tasks[waiting.id]["status"] == "QUEUED"
+
+
+def test_start_restores_persisted_tasks():
+    store = MemoryTaskStore()
+
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def blocking(payload):
+            await gate.wait()
+
+        first = TaskQueue(store=store, shutdown_timeout=0)
+        first.register("score", blocking, concurrency=1)
+        await first.start()
+        pending = await first.enqueue("score", {"candidate_id": "c-1"})
+        await first.stop()
+
+        handled = []
+
+        async def handler(payload):
+            handled.append(payload)
+
+        second = TaskQueue(store=store)
+        second.register("score", handler)
+        await second.start()
+        restored = await second.get(pending.id)
+        await _wait_for(lambda: restored.status == TaskStatus.SUCCEEDED)
+        await second.stop()
+        return handled
+
+    assert asyncio.run(scenario()) == [{"candidate_id": "c-1"}]
+
+
+def test_task_status_route_is_scoped_to_tenant(api_client):
+    async def scenario():
+        async def handler(payload):
+            return {"score": 0.9}
+
+        queue = TaskQueue()
+        queue.register("score", handler)
+        await queue.start()
+        task = await queue.enqueue("score", {"candidate_id": "c-1"}, tenant_id="tenant-a")
+        same_payload = await queue.enqueue("score", {"candidate_id": "c-1"}, tenant_id="tenant-b")
+        internal = await queue.enqueue("score", {"candidate_id": "c-2"})
+        await _wait_for(lambda: task.status == TaskStatus.SUCCEEDED)
+        await _wait_for(lambda: internal.status == TaskStatus.SUCCEEDED)
+
+        overrides = {get_task_queue: lambda: queue}
+        try:
+            async with api_client("tenant-a", overrides) as client:
+                own = await client.get(f"/v1/tasks/{task.id}")
+            async with api_client("tenant-b", overrides) as client:
+                other = await client.get(f"/v1/tasks/{task.id}")
+                untenanted = await client.get(f"/v1/tasks/{internal.id}")
+                missing = await client.get("/v1/tasks/unknown")
+        finally:
+            await queue.stop()
+        return own, other, untenanted, missing, same_payload.id != task.id
+
+    own, other, untenanted, missing, separate_tasks = asyncio.run(scenario())
+
+    assert own.status_code == 200
+    assert own.json()["status"] == "SUCCEEDED"
+    assert own.json()["result"] == {"score": 0.9}
+    assert other.status_code == 404
+    assert untenanted.status_code == 404
+    assert missing.status_code == 404
+    assert separate_tasks